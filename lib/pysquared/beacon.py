@@ -16,7 +16,6 @@ beacon.send()
 
 import json
 import time
-from collections import OrderedDict
 
 from microcontroller import Processor
 
@@ -32,10 +31,99 @@ from .protos.radio import RadioProto
 from .protos.temperature_sensor import TemperatureSensorProto
 from .sensor_reading.avg import avg_readings
 
-try:
-    from typing import OrderedDict
-except Exception:
-    pass
+# Schema field kinds, small ints so encoding dispatches on integer compares.
+# Readings are encoded as a timestamp and a scalar value, 3-axis readings as a
+# timestamp and one value per axis.
+_KIND_FLOAT = 0
+_KIND_INT = 1
+_KIND_STR = 2
+_KIND_READING = 3
+_KIND_VEC3 = 4
+
+_TIME_FORMAT = "%d-%02d-%02d %02d:%02d:%02d"
+
+# Initial size of the beacon's reused output buffer, grown if a beacon outgrows it
+_BEACON_BUFFER_SIZE = 256
+
+
+def _wire_keys(key: str, kind: int) -> tuple:
+    """Get the binary field keys a schema field is encoded under.
+
+    Args:
+        key: The schema key
+        kind: The schema kind
+
+    Returns:
+        Tuple of the encoded field keys in encoding order. For 3-axis readings the
+        value key is the base key passed to BinaryEncoder.add_vec3().
+    """
+    if kind == _KIND_READING:
+        return (key + "_timestamp", key + "_value")
+    if kind == _KIND_VEC3:
+        # The value key is the base key of the vector's _0, _1 and _2 fields
+        return (key + "_timestamp", key + "_value")
+    return (key,)
+
+
+def _get_processor_temperature(processor: Processor) -> float:
+    """Get the temperature of a processor.
+
+    Args:
+        processor: The processor to read
+
+    Returns:
+        The processor temperature in degrees Celsius
+    """
+    return processor.temperature
+
+
+def _get_modulation_name(radio: RadioProto) -> str:
+    """Get the name of a radio's current modulation.
+
+    Args:
+        radio: The radio to read
+
+    Returns:
+        The modulation name
+    """
+    return radio.get_modulation().__name__
+
+
+def _encode_float(encoder: BinaryEncoder, keys: tuple, value: float) -> None:
+    """Encode a float field."""
+    encoder.add_float(keys[0], value)
+
+
+def _encode_int(encoder: BinaryEncoder, keys: tuple, value: int) -> None:
+    """Encode an integer field."""
+    encoder.add_int(keys[0], int(value))
+
+
+def _encode_str(encoder: BinaryEncoder, keys: tuple, value: str) -> None:
+    """Encode a string field."""
+    encoder.add_string(keys[0], value)
+
+
+def _encode_reading(encoder: BinaryEncoder, keys: tuple, value) -> None:
+    """Encode a reading as its timestamp and scalar value."""
+    encoder.add_float(keys[0], value.timestamp)
+    encoder.add_float(keys[1], value.value)
+
+
+def _encode_vec3(encoder: BinaryEncoder, keys: tuple, value) -> None:
+    """Encode a 3-axis reading as its timestamp and one value per axis."""
+    encoder.add_float(keys[0], value.timestamp)
+    encoder.add_vec3(keys[1], value.value)
+
+
+# Field encoders indexed by schema kind, resolved once when the schema is built
+_FIELD_ENCODERS = (
+    _encode_float,
+    _encode_int,
+    _encode_str,
+    _encode_reading,
+    _encode_vec3,
+)
 
 
 class Beacon:
@@ -81,302 +169,221 @@ class Beacon:
             ...,
         ] = args
 
-    def send(self) -> bool:
-        """Sends the beacon.
+        # The set of fields is fixed by the sensors, so work it out only once
+        self._schema: tuple = self._compute_schema()
+
+        # Every send encodes into the same encoder and output buffer
+        self._encoder: BinaryEncoder = BinaryEncoder()
+        self._buffer: bytearray = bytearray(_BEACON_BUFFER_SIZE)
+        self._view: memoryview = memoryview(self._buffer)
+
+    def _compute_schema(self) -> tuple:
+        """Compute the beacon's fields from its name and sensors.
 
         Returns:
-            True if the beacon was sent successfully, False otherwise.
+            Tuple of (key, wire_keys, kind, encode, getter, arg, error_msg,
+            sensor_name, index) entries in beacon order. A field's value is
+            getter(arg), or getter() when arg is None, and is added to an encoder
+            with encode(encoder, wire_keys, value). Fields whose error_msg is None
+            are not expected to fail.
         """
-        state = self._build_state()
-        # Use binary encoding for efficiency
-        b = self._encode_binary_state(state)
-        return self._packet_manager.send(b)
+        schema = [
+            ("name", _KIND_STR, self._get_name, None, None, None, None),
+            ("time", _KIND_STR, self._get_time, None, None, None, None),
+            ("uptime", _KIND_FLOAT, self._get_uptime, None, None, None, None),
+        ]
+        for index, sensor in enumerate(self._sensors):
+            schema.extend(self._sensor_schema(sensor, index))
 
-    def _encode_binary_state(self, state: OrderedDict[str, object]) -> bytes:
-        """Encode the state dictionary using binary encoding for efficiency.
+        # Build every wire key and pick every encoder here so encoding never
+        # assembles key strings or dispatches on the field kind
+        compiled = []
+        for entry in schema:
+            key, kind = entry[0], entry[1]
+            compiled.append(
+                (key, _wire_keys(key, kind), kind, _FIELD_ENCODERS[kind]) + entry[2:]
+            )
+        return tuple(compiled)
 
-        Uses explicit encoding based on known beacon data structure for safety and performance.
+    def _sensor_schema(self, sensor, index: int) -> list:
+        """Compute the fields contributed by a single sensor.
 
         Args:
-            state: The state dictionary to encode
+            sensor: The sensor instance.
+            index: The index of the sensor in the beacon.
 
         Returns:
-            Binary encoded data
+            List of (key, kind, getter, arg, error_msg, sensor_name, index) entries,
+            empty if the sensor type is not supported.
         """
-        encoder = BinaryEncoder()
+        if isinstance(sensor, (Flag, Counter)):
+            key = f"{sensor.get_name()}_{index}"
+            return [(key, _KIND_INT, sensor.get, None, None, None, None)]
 
-        for key, value in state.items():
-            self._encode_known_value(encoder, key, value)
+        sensor_name = sensor.__class__.__name__
+        prefix = f"{sensor_name}_{index}"
 
-        return encoder.to_bytes()
+        fields = []
+        if isinstance(sensor, Processor):
+            fields = [
+                ("temperature", _KIND_FLOAT, _get_processor_temperature, sensor, None)
+            ]
+        elif isinstance(sensor, RadioProto):
+            fields = [("modulation", _KIND_STR, _get_modulation_name, sensor, None)]
+        elif isinstance(sensor, IMUProto):
+            fields = [
+                (
+                    "acceleration",
+                    _KIND_VEC3,
+                    sensor.get_acceleration,
+                    None,
+                    "Error retrieving acceleration",
+                ),
+                (
+                    "angular_velocity",
+                    _KIND_VEC3,
+                    sensor.get_angular_velocity,
+                    None,
+                    "Error retrieving angular velocity",
+                ),
+            ]
+        elif isinstance(sensor, MagnetometerProto):
+            fields = [
+                (
+                    "magnetic_field",
+                    _KIND_VEC3,
+                    sensor.get_magnetic_field,
+                    None,
+                    "Error retrieving magnetic field",
+                ),
+            ]
+        elif isinstance(sensor, PowerMonitorProto):
+            fields = [
+                (
+                    "current_avg",
+                    _KIND_FLOAT,
+                    avg_readings,
+                    sensor.get_current,
+                    "Error retrieving current",
+                ),
+                (
+                    "bus_voltage_avg",
+                    _KIND_FLOAT,
+                    avg_readings,
+                    sensor.get_bus_voltage,
+                    "Error retrieving bus voltage",
+                ),
+                (
+                    "shunt_voltage_avg",
+                    _KIND_FLOAT,
+                    avg_readings,
+                    sensor.get_shunt_voltage,
+                    "Error retrieving shunt voltage",
+                ),
+            ]
+        elif isinstance(sensor, TemperatureSensorProto):
+            fields = [
+                (
+                    "temperature",
+                    _KIND_READING,
+                    sensor.get_temperature,
+                    None,
+                    "Error retrieving temperature",
+                ),
+            ]
+
+        return [
+            (f"{prefix}_{name}", kind, getter, arg, error_msg, sensor_name, index)
+            for name, kind, getter, arg, error_msg in fields
+        ]
 
-    def _encode_known_value(
-        self, encoder: BinaryEncoder, key: str, value: object
-    ) -> None:
-        """Encode a value based on its actual type.
+    def send(self) -> bool:
+        """Sends the beacon.
 
-        This method uses direct type checking for cleaner and more reliable encoding
-        without relying on key name patterns.
+        Returns:
+            True if the beacon was sent successfully, False otherwise.
+        """
+        # Use binary encoding for efficiency
+        encoder = self._encoder
+        encoder.reset()
+        self._encode_all(encoder)
+
+        size = encoder.encoded_size()
+        if size > len(self._buffer):
+            self._buffer = bytearray(size)
+            self._view = memoryview(self._buffer)
+        encoder.pack_into(self._buffer)
+        return self._packet_manager.send(self._view[:size])
+
+    def _encode_all(self, encoder: BinaryEncoder) -> None:
+        """Read every beacon field and encode it straight into the encoder.
+
+        Fields whose reading fails are logged and left out.
 
         Args:
             encoder: The binary encoder to add data to
-            key: The key name for the value
-            value: The value to encode
         """
-        if isinstance(value, dict):
-            self._encode_sensor_dict(encoder, key, value)
-        elif isinstance(value, (list, tuple)):
-            if len(value) == 3 and all(isinstance(v, (int, float)) for v in value):
-                # Handle 3D vectors (acceleration, gyroscope) by splitting into components
-                for i, v in enumerate(value):
-                    encoder.add_float(f"{key}_{i}", float(v))
-            else:
-                # Non-numeric or non-3D arrays as strings
-                encoder.add_string(key, str(value))
-        elif isinstance(value, bool):
-            encoder.add_int(key, int(value))
-        elif isinstance(value, int):
-            encoder.add_int(key, value)
-        elif isinstance(value, float):
-            encoder.add_float(key, value)
-        else:
-            # Fallback for all other types (strings, etc.)
-            encoder.add_string(key, str(value))
-
-    def _safe_float_convert(self, value: object) -> float:
-        """Safely convert a value to float with proper type checking.
+        for _, keys, _, encode, getter, arg, error_msg, sensor_name, index in (
+            self._schema
+        ):
+            if error_msg is None:
+                encode(encoder, keys, getter() if arg is None else getter(arg))
+                continue
 
-        Args:
-            value: The value to convert to float
+            try:
+                value = getter() if arg is None else getter(arg)
+            except Exception as e:
+                self._log.error(error_msg, e, sensor=sensor_name, index=index)
+                continue
+            encode(encoder, keys, value)
 
-        Returns:
-            Float representation of the value
+    def _collect(self) -> list:
+        """Read the current value of every beacon field for the JSON beacon.
 
-        Raises:
-            ValueError: If the value cannot be converted to float
-        """
-        if isinstance(value, (int, float)):
-            return float(value)
-        elif isinstance(value, str):
-            return float(value)
-        else:
-            raise ValueError(f"Cannot convert {type(value).__name__} to float: {value}")
-
-    def _encode_sensor_dict(
-        self, encoder: BinaryEncoder, key: str, sensor_data: dict
-    ) -> None:
-        """Encode sensor data dictionary with known structure.
-
-        Handles sensor readings that come from to_dict() methods with known structure
-        like {timestamp: float, value: float|list}.
+        Fields whose reading fails are logged and left out.
 
-        Args:
-            encoder: The binary encoder to add data to
-            key: The base key name
-            sensor_data: Dictionary containing sensor readings
+        Returns:
+            List of (key, kind, value) entries in beacon order
         """
-        for dict_key, dict_value in sensor_data.items():
-            full_key = f"{key}_{dict_key}"
-            if dict_key == "timestamp":
-                encoder.add_float(full_key, self._safe_float_convert(dict_value))
-            elif isinstance(dict_value, (list, tuple)) and len(dict_value) == 3:
-                # Handle 3D vectors (acceleration, gyroscope)
-                for i, v in enumerate(dict_value):
-                    encoder.add_float(f"{full_key}_{i}", self._safe_float_convert(v))
-            elif isinstance(dict_value, (int, float)):
-                encoder.add_float(full_key, float(dict_value))
-            else:
-                encoder.add_string(full_key, str(dict_value))
-
-    def _build_state(self) -> OrderedDict[str, object]:
+        values = []
+        for key, _, kind, _, getter, arg, error_msg, sensor_name, index in (
+            self._schema
+        ):
+            if error_msg is None:
+                values.append((key, kind, getter() if arg is None else getter(arg)))
+                continue
+
+            try:
+                values.append((key, kind, getter() if arg is None else getter(arg)))
+            except Exception as e:
+                self._log.error(error_msg, e, sensor=sensor_name, index=index)
+        return values
+
+    def _build_state(self) -> dict[str, object]:
         """Build the beacon state dictionary from sensors.
 
         Returns:
-            OrderedDict containing all beacon data
+            Dictionary containing all beacon data
         """
-        state: OrderedDict[str, object] = OrderedDict()
-        self._add_system_info(state)
-        self._add_sensor_data(state)
+        state: dict[str, object] = {}
+        for key, kind, value in self._collect():
+            if kind == _KIND_READING or kind == _KIND_VEC3:
+                value = value.to_dict()
+            state[key] = value
         return state
 
-    def _add_system_info(self, state: OrderedDict[str, object]) -> None:
-        """Adds system information to the beacon state.
-
-        Args:
-            state: The state dictionary to update.
-        """
-        state["name"] = self._name
+    def _get_name(self) -> str:
+        """Get the name of the beacon."""
+        return self._name
 
+    def _get_time(self) -> str:
+        """Get the current time formatted for the beacon."""
         now = time.localtime()  # type: ignore # PR: https://github.com/adafruit/circuitpython/pull/10603
-        state["time"] = (
-            f"{now.tm_year}-{now.tm_mon:02d}-{now.tm_mday:02d} {now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"  # type: ignore # PR: https://github.com/adafruit/circuitpython/pull/10603
-        )
-
-        state["uptime"] = time.time() - self._boot_time
-
-    def _add_sensor_data(self, state: OrderedDict[str, object]) -> None:
-        """Adds sensor data to the beacon state.
-
-        Args:
-            state: The state dictionary to update.
-        """
-        for index, sensor in enumerate(self._sensors):
-            if isinstance(sensor, Processor):
-                self._add_processor_data(state, sensor, index)
-            elif isinstance(sensor, Flag):
-                self._add_flag_data(state, sensor, index)
-            elif isinstance(sensor, Counter):
-                self._add_counter_data(state, sensor, index)
-            elif isinstance(sensor, RadioProto):
-                self._add_radio_data(state, sensor, index)
-            elif isinstance(sensor, IMUProto):
-                self._add_imu_data(state, sensor, index)
-            elif isinstance(sensor, MagnetometerProto):
-                self._add_magnetometer_data(state, sensor, index)
-            elif isinstance(sensor, PowerMonitorProto):
-                self._add_power_monitor_data(state, sensor, index)
-            elif isinstance(sensor, TemperatureSensorProto):
-                self._add_temperature_sensor_data(state, sensor, index)
-
-    def _add_processor_data(
-        self, state: OrderedDict[str, object], sensor: Processor, index: int
-    ) -> None:
-        """Adds processor data to the beacon state."""
-        sensor_name = sensor.__class__.__name__
-        state[f"{sensor_name}_{index}_temperature"] = sensor.temperature
-
-    def _add_flag_data(
-        self, state: OrderedDict[str, object], sensor: Flag, index: int
-    ) -> None:
-        """Adds flag data to the beacon state."""
-        state[f"{sensor.get_name()}_{index}"] = sensor.get()
-
-    def _add_counter_data(
-        self, state: OrderedDict[str, object], sensor: Counter, index: int
-    ) -> None:
-        """Adds counter data to the beacon state."""
-        state[f"{sensor.get_name()}_{index}"] = sensor.get()
-
-    def _add_radio_data(
-        self, state: OrderedDict[str, object], sensor: RadioProto, index: int
-    ) -> None:
-        """Adds radio data to the beacon state."""
-        sensor_name = sensor.__class__.__name__
-        state[f"{sensor_name}_{index}_modulation"] = sensor.get_modulation().__name__
-
-    def _add_imu_data(
-        self, state: OrderedDict[str, object], sensor: IMUProto, index: int
-    ) -> None:
-        """Adds IMU data to the beacon state."""
-        sensor_name = sensor.__class__.__name__
-
-        self._safe_add_sensor_reading(
-            state,
-            f"{sensor_name}_{index}_acceleration",
-            lambda: sensor.get_acceleration().to_dict(),
-            "Error retrieving acceleration",
-            sensor_name,
-            index,
-        )
-
-        self._safe_add_sensor_reading(
-            state,
-            f"{sensor_name}_{index}_angular_velocity",
-            lambda: sensor.get_angular_velocity().to_dict(),
-            "Error retrieving angular velocity",
-            sensor_name,
-            index,
-        )
-
-    def _add_magnetometer_data(
-        self, state: OrderedDict[str, object], sensor: MagnetometerProto, index: int
-    ) -> None:
-        """Adds magnetometer data to the beacon state."""
-        sensor_name = sensor.__class__.__name__
-
-        self._safe_add_sensor_reading(
-            state,
-            f"{sensor_name}_{index}_magnetic_field",
-            lambda: sensor.get_magnetic_field().to_dict(),
-            "Error retrieving magnetic field",
-            sensor_name,
-            index,
-        )
-
-    def _add_power_monitor_data(
-        self, state: OrderedDict[str, object], sensor: PowerMonitorProto, index: int
-    ) -> None:
-        """Adds power monitor data to the beacon state."""
-        sensor_name = sensor.__class__.__name__
-
-        self._safe_add_sensor_reading(
-            state,
-            f"{sensor_name}_{index}_current_avg",
-            lambda: avg_readings(sensor.get_current),
-            "Error retrieving current",
-            sensor_name,
-            index,
-        )
-
-        self._safe_add_sensor_reading(
-            state,
-            f"{sensor_name}_{index}_bus_voltage_avg",
-            lambda: avg_readings(sensor.get_bus_voltage),
-            "Error retrieving bus voltage",
-            sensor_name,
-            index,
-        )
-
-        self._safe_add_sensor_reading(
-            state,
-            f"{sensor_name}_{index}_shunt_voltage_avg",
-            lambda: avg_readings(sensor.get_shunt_voltage),
-            "Error retrieving shunt voltage",
-            sensor_name,
-            index,
-        )
-
-    def _add_temperature_sensor_data(
-        self,
-        state: OrderedDict[str, object],
-        sensor: TemperatureSensorProto,
-        index: int,
-    ) -> None:
-        """Adds temperature sensor data to the beacon state."""
-        sensor_name = sensor.__class__.__name__
-
-        self._safe_add_sensor_reading(
-            state,
-            f"{sensor_name}_{index}_temperature",
-            lambda: sensor.get_temperature().to_dict(),
-            "Error retrieving temperature",
-            sensor_name,
-            index,
-        )
-
-    def _safe_add_sensor_reading(
-        self,
-        state: OrderedDict[str, object],
-        key: str,
-        reading_func,
-        error_msg: str,
-        sensor_name: str,
-        index: int,
-    ) -> None:
-        """Safely adds a sensor reading to the state with error handling.
+        return _TIME_FORMAT % now[:6]
 
-        Args:
-            state: The state dictionary to update.
-            key: The key to store the reading under.
-            reading_func: Function that returns the sensor reading.
-            error_msg: Error message to log if reading fails.
-            sensor_name: Name of the sensor for logging.
-            index: Index of the sensor for logging.
-        """
-        try:
-            state[key] = reading_func()
-        except Exception as e:
-            self._log.error(error_msg, e, sensor=sensor_name, index=index)
+    def _get_uptime(self) -> float:
+        """Get the time since boot in seconds."""
+        return time.time() - self._boot_time
 
     def send_json(self) -> bool:
         """Sends the beacon using JSON encoding (legacy method).
@@ -405,104 +412,19 @@ class Beacon:
     def generate_key_mapping(self) -> dict:
         """Create a key mapping for this beacon's data structure.
 
-        This method generates a template beacon packet and returns the key mapping
-        that can be used to decode binary beacon data with the same structure.
+        The mapping covers every field in the beacon's schema, including fields of
+        sensors that fail during actual data collection.
 
         Returns:
             Dictionary mapping key hashes to key names
         """
-        # Create a template state to get the key structure
-        state = self._build_template_state()
-
-        # Encode to get key mapping
         encoder = BinaryEncoder()
-        for key, value in state.items():
-            if isinstance(value, str):
-                encoder.add_string(key, value)
-            elif isinstance(value, float):
-                encoder.add_float(key, value)
-            elif isinstance(value, int):
-                encoder.add_int(key, value)
-            elif isinstance(value, bool):
-                encoder.add_int(key, int(value), size=1)
-
-        # Generate the binary data to populate key map
-        encoder.to_bytes()
+        for _, keys, kind, _, _, _, _, _, _ in self._schema:
+            if kind == _KIND_VEC3:
+                encoder.add_float(keys[0], 0.0)
+                encoder.add_vec3(keys[1], (0.0, 0.0, 0.0))
+                continue
+
+            for wire_key in keys:
+                encoder.add_int(wire_key, 0)
         return encoder.get_key_map()
-
-    def _build_template_state(self) -> OrderedDict[str, object]:
-        """Build a template state dictionary for key mapping.
-
-        Returns:
-            OrderedDict containing template beacon data with the same structure
-        """
-        state: OrderedDict[str, object] = OrderedDict()
-        self._add_template_system_info(state)
-        self._add_template_sensor_data(state)
-        return state
-
-    def _add_template_system_info(self, state: OrderedDict[str, object]) -> None:
-        """Add template system information to the state dictionary.
-
-        Args:
-            state: The state dictionary to update
-        """
-        state["name"] = self._name
-        state["time"] = "template"
-        state["uptime"] = 0.0
-
-    def _add_template_sensor_data(self, state: OrderedDict[str, object]) -> None:
-        """Add template sensor data to the state dictionary.
-
-        This method adds template data for each sensor type to ensure consistent
-        structure even when sensors fail during actual data collection.
-
-        Args:
-            state: The state dictionary to update
-        """
-        for index, sensor in enumerate(self._sensors):
-            self._add_template_for_sensor(state, sensor, index)
-
-    def _add_template_for_sensor(
-        self, state: OrderedDict[str, object], sensor, index: int
-    ) -> None:
-        """Add template data for a specific sensor.
-
-        Args:
-            state: The state dictionary to update
-            sensor: The sensor instance
-            index: The sensor index
-        """
-        if isinstance(sensor, Processor):
-            sensor_name = sensor.__class__.__name__
-            state[f"{sensor_name}_{index}_temperature"] = 0.0
-        elif isinstance(sensor, Flag):
-            state[f"{sensor.get_name()}_{index}"] = False
-        elif isinstance(sensor, Counter):
-            state[f"{sensor.get_name()}_{index}"] = 0
-        elif isinstance(sensor, RadioProto):
-            sensor_name = sensor.__class__.__name__
-            state[f"{sensor_name}_{index}_modulation"] = "template"
-        elif isinstance(sensor, IMUProto):
-            sensor_name = sensor.__class__.__name__
-            # Add template data for all IMU fields that would be created
-            state[f"{sensor_name}_{index}_acceleration_timestamp"] = 0.0
-            state[f"{sensor_name}_{index}_angular_velocity_timestamp"] = 0.0
-            for i in range(3):
-                state[f"{sensor_name}_{index}_acceleration_value_{i}"] = 0.0
-                state[f"{sensor_name}_{index}_angular_velocity_value_{i}"] = 0.0
-        elif isinstance(sensor, MagnetometerProto):
-            sensor_name = sensor.__class__.__name__
-            # Add template data for all magnetometer fields that would be created
-            state[f"{sensor_name}_{index}_magnetic_field_timestamp"] = 0.0
-            for i in range(3):
-                state[f"{sensor_name}_{index}_magnetic_field_value_{i}"] = 0.0
-        elif isinstance(sensor, PowerMonitorProto):
-            sensor_name = sensor.__class__.__name__
-            state[f"{sensor_name}_{index}_current_avg"] = 0.0
-            state[f"{sensor_name}_{index}_bus_voltage_avg"] = 0.0
-            state[f"{sensor_name}_{index}_shunt_voltage_avg"] = 0.0
-        elif isinstance(sensor, TemperatureSensorProto):
-            sensor_name = sensor.__class__.__name__
-            state[f"{sensor_name}_{index}_temperature_timestamp"] = 0.0
-            state[f"{sensor_name}_{index}_temperature_value"] = 0.0
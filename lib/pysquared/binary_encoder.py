@@ -17,64 +17,402 @@ battery_level = decoder.get_int("battery_level")
 ```
 """
 
+import binascii
+import io
 import struct
-from collections import OrderedDict
 
 try:
-    from typing import Dict, Optional, Tuple, Union
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    from typing import Dict, List, Optional, Tuple, Union
 except ImportError:
     pass
 
 
+class _Stream:
+    """Write cursor over a pre-sized output buffer."""
+
+    def __init__(self, buf: bytearray, offset: int = 0) -> None:
+        """Initialize the stream.
+
+        Args:
+            buf: Output buffer, large enough for everything written to it
+            offset: Offset in the buffer to start writing at
+        """
+        self.buf = buf
+        self.offset = offset
+
+    def pack(self, fmt: str, size: int, *values: Union[int, float]) -> None:
+        """Pack values in place at the current offset and advance past them.
+
+        Args:
+            fmt: Struct format of the values
+            size: Packed size of the format in bytes
+            *values: Values to pack
+        """
+        struct.pack_into(fmt, self.buf, self.offset, *values)
+        self.offset += size
+
+    def write(self, data: bytes) -> None:
+        """Copy raw bytes in at the current offset and advance past them.
+
+        Args:
+            data: Bytes to write
+        """
+        end = self.offset + len(data)
+        self.buf[self.offset : end] = data
+        self.offset = end
+
+
+def _write_value(
+    stream: _Stream,
+    field_format: str,
+    type_id: int,
+    header_size: int,
+    key_hash: int,
+    value: Union[int, float, bytes],
+) -> None:
+    """Write a fixed-size numeric field."""
+    stream.pack(field_format, header_size, key_hash, type_id, value)
+
+
+def _write_encoded(
+    stream: _Stream,
+    field_format: str,
+    type_id: int,
+    header_size: int,
+    key_hash: int,
+    value: bytes,
+) -> None:
+    """Write a field whose header and payload were pre-encoded when it was added."""
+    stream.write(value)
+
+
+def _field_format(writer, struct_format: str, type_id: int) -> Tuple:
+    """Build a field table entry.
+
+    Args:
+        writer: Function writing the field into the output stream
+        struct_format: Struct format covering the key hash, type id and value
+        type_id: Type identifier written to the wire
+
+    Returns:
+        Tuple of (writer, struct_format, type_id, packed_size)
+    """
+    return writer, struct_format, type_id, struct.calcsize(struct_format)
+
+
+# Three single-precision float fields packed with one struct call by add_vec3
+_VEC3_FORMAT = ">IBfIBfIBf"
+_VEC3_SIZE = struct.calcsize(_VEC3_FORMAT)
+
+# Field format -> (writer, struct format, type id, packed size). String fields
+# pack their length byte with the header and varint fields pack only the
+# header; both are followed by their raw payload bytes and are pre-encoded
+# when added. Vector records ("3") hold three complete float fields.
+_FIELD_FORMATS = {
+    "s": _field_format(_write_encoded, ">IBB", 0),
+    "b": _field_format(_write_value, ">IBb", 1),
+    "h": _field_format(_write_value, ">IBh", 2),
+    "i": _field_format(_write_value, ">IBi", 3),
+    "q": _field_format(_write_value, ">IBq", 4),
+    "f": _field_format(_write_value, ">IBf", 5),
+    "d": _field_format(_write_value, ">IBd", 6),
+    "B": _field_format(_write_value, ">IBB", 11),
+    "H": _field_format(_write_value, ">IBH", 12),
+    "I": _field_format(_write_value, ">IBI", 13),
+    "Q": _field_format(_write_value, ">IBQ", 14),
+    "v": _field_format(_write_encoded, ">IB", 20),
+    "u": _field_format(_write_encoded, ">IB", 21),
+    "3": _field_format(_write_encoded, _VEC3_FORMAT, 5),
+}
+
+# Type id -> (struct format, size) for fixed-size numeric values, with
+# separate signed/unsigned integer types
+_VALUE_FORMATS = {
+    1: (">b", 1),  # 1-byte signed int
+    2: (">h", 2),  # 2-byte signed int
+    3: (">i", 4),  # 4-byte signed int
+    4: (">q", 8),  # 8-byte signed int
+    5: (">f", 4),  # 4-byte float
+    6: (">d", 8),  # 8-byte float
+    11: (">B", 1),  # 1-byte unsigned int
+    12: (">H", 2),  # 2-byte unsigned int
+    13: (">I", 4),  # 4-byte unsigned int
+    14: (">Q", 8),  # 8-byte unsigned int
+}
+
+# Field formats followed by a variable-length payload
+_PAYLOAD_FORMATS = ("s", "v", "u")
+
+# Fixed-size numeric field formats, the ones a CompiledSchema can hold
+_SCHEMA_FORMATS = ("b", "h", "i", "q", "f", "d", "B", "H", "I", "Q")
+
+# Vector key -> ((component key, key hash), ...) for add_vec3, shared by all
+# encoders so repeated packets don't rebuild and rehash the component keys
+_vec3_components = {}
+
+
+def _key_hash(key: str) -> int:
+    """Hash a key name for the wire.
+
+    Uses a stable CRC32 of the key instead of storing the full key. Unlike hash(),
+    it is identical across interpreters, runs and reboots.
+
+    Args:
+        key: The key name
+
+    Returns:
+        The 4-byte key hash
+    """
+    return binascii.crc32(key.encode("utf-8")) & 0xFFFFFFFF
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as an LEB128 varint.
+
+    Args:
+        value: The non-negative integer to encode
+
+    Returns:
+        The varint bytes, 7 bits per byte with the high bit marking continuation
+    """
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _decode_varint(data: bytes, offset: int) -> Tuple[Optional[int], int]:
+    """Decode an LEB128 varint.
+
+    Args:
+        data: Binary data
+        offset: Offset of the varint in data
+
+    Returns:
+        Tuple of (value, bytes_consumed) or (None, 0) if the varint is truncated
+    """
+    data_len = len(data)
+    if offset >= data_len:
+        return None, 0
+
+    # Most telemetry values fit in a single byte, so skip the loop for them
+    byte = data[offset]
+    if byte < 0x80:
+        return byte, 1
+
+    value = byte & 0x7F
+    shift = 7
+    end = offset + 1
+    while end < data_len:
+        byte = data[end]
+        end += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, end - offset
+        shift += 7
+
+    return None, 0
+
+
+class CompiledSchema:
+    """A fixed packet layout packed with a single struct call.
+
+    Telemetry that sends the same fixed-size numeric fields every time can compile
+    its layout once and then pack each packet in one call instead of field by field.
+    The output is the same wire format as BinaryEncoder.to_bytes().
+    """
+
+    def __init__(self, fields: List[Tuple[str, str]]) -> None:
+        """Initialize the compiled schema.
+
+        Args:
+            fields: List of (key, fmt) pairs, where fmt is a fixed-size numeric
+                struct format character (b, h, i, q, f, d, B, H, I or Q)
+
+        Raises:
+            ValueError: If a field format is not a fixed-size numeric format
+        """
+        struct_format = ">"
+        args: List[Union[int, float]] = []
+        slots: List[int] = []
+        self.keys: List[str] = []
+
+        for key, fmt in fields:
+            if fmt not in _SCHEMA_FORMATS:
+                raise ValueError(f"Unsupported schema field format: {fmt}")
+
+            struct_format += "IB" + fmt
+            slots.append(len(args) + 2)
+            args.extend((_key_hash(key), _FIELD_FORMATS[fmt][2], 0))
+            self.keys.append(key)
+
+        self.format = struct_format
+        self.size = struct.calcsize(struct_format)
+        self._args = args
+        self._slots = slots
+
+    @property
+    def slots(self) -> List[int]:
+        """Positions of the field values in the schema's unpacked tuple."""
+        return self._slots
+
+    def matches(self, fields: Tuple) -> bool:
+        """Check that unpacked fields carry this schema's key hashes and type ids.
+
+        Args:
+            fields: Tuple unpacked with the schema's format
+
+        Returns:
+            True if every field header matches the schema
+        """
+        args = self._args
+        for slot in self._slots:
+            if fields[slot - 2] != args[slot - 2] or fields[slot - 1] != args[slot - 1]:
+                return False
+        return True
+
+    def pack_into(
+        self, buf: bytearray, offset: int, values: List[Union[int, float]]
+    ) -> None:
+        """Pack one packet in place into a pre-allocated buffer.
+
+        Args:
+            buf: Buffer with at least size bytes free after offset
+            offset: Offset in the buffer to pack at
+            values: Field values, in schema order
+
+        Raises:
+            ValueError: If the number of values does not match the schema
+        """
+        if len(values) != len(self._slots):
+            raise ValueError(f"Expected {len(self._slots)} values, got {len(values)}")
+
+        args = self._args
+        slots = self._slots
+        for i in range(len(slots)):
+            args[slots[i]] = values[i]
+
+        struct.pack_into(self.format, buf, offset, *args)
+
+    def pack(self, values: List[Union[int, float]]) -> bytes:
+        """Pack one packet.
+
+        Args:
+            values: Field values, in schema order
+
+        Returns:
+            The binary representation of the packet
+        """
+        buf = bytearray(self.size)
+        self.pack_into(buf, 0, values)
+        return bytes(buf)
+
+
 class BinaryEncoder:
     """Encodes data into a compact binary format."""
 
     def __init__(self) -> None:
         """Initialize the binary encoder."""
-        self._data: OrderedDict[str, Tuple[str, Union[int, float, str, bytes]]] = (
-            OrderedDict()
-        )
+        # Records of (key, key_hash, fmt, value, encoded_size) in insertion order
+        self._records: List[Tuple[str, int, str, Union[int, float, bytes], int]] = []
+        self._index: Dict[str, int] = {}
         self._key_map: Dict[int, str] = {}
+        self._frozen = False
 
     def get_key_map(self) -> Dict[int, str]:
         """Get the key mapping for decoding.
 
+        Once the encoder is frozen the key map can no longer change, so the shared
+        map is returned without copying. Callers must not modify it.
+
         Returns:
             Dictionary mapping key hashes to key names
         """
+        if self._frozen:
+            return self._key_map
         return self._key_map.copy()
 
-    def add_int(self, key: str, value: int, size: int | None = None) -> None:
-        """Add an integer value.
+    def freeze(self) -> None:
+        """Seal the set of keys.
+
+        Existing keys can still be updated with new values, but adding a new key
+        raises ValueError. This lets decoders share the key map safely.
+        """
+        self._frozen = True
+
+    def _register_key(self, key: str) -> int:
+        """Hash a key and record it in the key map.
 
         Args:
-            key: The key name for the value
-            value: The integer value
-            size: Size in bytes (1, 2, 4, or 8). If None, automatically determined based on value range.
+            key: The key name
+
+        Returns:
+            The 4-byte key hash
+
+        Raises:
+            ValueError: If the key is new and the encoder is frozen
         """
-        if size is None:
-            size = self._determine_int_size(value)
+        key_hash = _key_hash(key)
+        self._register_hash(key, key_hash)
+        return key_hash
 
-        fmt = self._get_int_format(size, value)
-        self._data[key] = (fmt, value)
+    def _register_hash(self, key: str, key_hash: int) -> None:
+        """Record an already hashed key in the key map.
 
-    def _determine_int_size(self, value: int) -> int:
-        """Determine the optimal size for an integer value.
+        Args:
+            key: The key name
+            key_hash: The key's 4-byte hash
+
+        Raises:
+            ValueError: If the key is new and the encoder is frozen
+        """
+        if self._frozen and key_hash not in self._key_map:
+            raise ValueError(f"Cannot add key to frozen encoder: {key}")
+        self._key_map.setdefault(key_hash, key)
+
+    def compile_schema(self, fields: List[Tuple[str, str]]) -> CompiledSchema:
+        """Compile a fixed packet layout and register its keys for decoding.
 
         Args:
-            value: The integer value
+            fields: List of (key, fmt) pairs, where fmt is a fixed-size numeric
+                struct format character (b, h, i, q, f, d, B, H, I or Q)
 
         Returns:
-            Size in bytes (1, 2, 4, or 8)
+            The compiled schema
+        """
+        schema = CompiledSchema(fields)
+        for key in schema.keys:
+            self._register_key(key)
+        return schema
+
+    def add_int(self, key: str, value: int, size: int | None = None) -> None:
+        """Add an integer value.
+
+        Args:
+            key: The key name for the value
+            value: The integer value
+            size: Fixed size in bytes (1, 2, 4, or 8). If None, the value is encoded as a
+                variable-length LEB128 varint so small values only take a single byte.
         """
-        if -128 <= value <= 255:  # Fits in 1 byte
-            return 1
-        elif -32768 <= value <= 32767:  # Fits in 2 bytes
-            return 2
-        elif -2147483648 <= value <= 2147483647:  # Fits in 4 bytes
-            return 4
-        else:  # Use 8 bytes for large values
-            return 8
+        value = int(value)
+
+        if size is None:
+            # Non-negative values use a plain varint, negative values are zigzag encoded
+            if value >= 0:
+                self._add(key, "u", _encode_varint(value))
+            else:
+                self._add(key, "v", _encode_varint(((~value) << 1) | 1))
+            return
+
+        fmt = self._get_int_format(size, value)
+        self._add(key, fmt, value)
 
     def _get_int_format(self, size: int, value: int) -> str:
         """Get the struct format string for an integer.
@@ -111,7 +449,7 @@ class BinaryEncoder:
             double_precision: Use double precision (8 bytes) instead of single (4 bytes)
         """
         fmt = "d" if double_precision else "f"
-        self._data[key] = (fmt, value)
+        self._add(key, fmt, float(value))
 
     def add_string(self, key: str, value: str, max_length: int = 255) -> None:
         """Add a string value with length prefix.
@@ -125,144 +463,183 @@ class BinaryEncoder:
         if len(encoded_value) > max_length:
             raise ValueError(f"String too long: {len(encoded_value)} > {max_length}")
 
-        # Use 's' format for strings
-        self._data[key] = ("s", encoded_value)
+        # Store the encoded bytes so encoding never re-encodes the string
+        self._add(key, "s", encoded_value)
 
-    def to_bytes(self) -> bytes:
-        """Convert the encoded data to bytes using a compact format.
+    def add_vec3(self, key: str, values: Tuple[float, float, float]) -> None:
+        """Add a 3-component vector as the float fields key_0, key_1 and key_2.
 
-        Format: [key_hash:4][type:1][data:variable]...
+        All three fields are packed with a single struct call.
 
-        Returns:
-            The binary representation of all added data
+        Args:
+            key: The base key name for the vector
+            values: The x, y and z components
         """
-        if not self._data:
-            return b""
-
-        result = b""
+        components = _vec3_components.get(key)
+        if components is None:
+            components = tuple((f"{key}_{i}", _key_hash(f"{key}_{i}")) for i in range(3))
+            _vec3_components[key] = components
+
+        for component, key_hash in components:
+            self._register_hash(component, key_hash)
+
+        type_id = _FIELD_FORMATS["f"][2]
+        x, y, z = values
+        value = struct.pack(
+            _VEC3_FORMAT,
+            components[0][1],
+            type_id,
+            x,
+            components[1][1],
+            type_id,
+            y,
+            components[2][1],
+            type_id,
+            z,
+        )
+        self._store_record((key, components[0][1], "3", value, _VEC3_SIZE))
 
-        for key, (fmt, value) in self._data.items():
-            # Use a simple hash of the key instead of storing the full key
-            key_hash = hash(key) & 0xFFFFFFFF  # 4-byte hash
-            self._key_map[key_hash] = key
+    def _add(self, key: str, fmt: str, value: Union[int, float, bytes]) -> None:
+        """Store a field record, replacing any previous value for the key.
 
-            result += self._encode_field(key_hash, fmt, value)
+        The key hash is computed and registered in the key map once here, so
+        encoding only reads the records.
 
-        return result
+        Args:
+            key: The key name for the value
+            fmt: Field format from the field format table
+            value: The value to encode
+        """
+        key_hash = self._register_key(key)
+
+        _, field_format, type_id, size = _FIELD_FORMATS[fmt]
+        if fmt in _PAYLOAD_FORMATS:
+            # Pre-encode the header with the payload so encoding is a single copy
+            if fmt == "s":
+                header = struct.pack(field_format, key_hash, type_id, len(value))
+            else:
+                header = struct.pack(field_format, key_hash, type_id)
+            value = header + value
+            size = len(value)
+        self._store_record((key, key_hash, fmt, value, size))
+
+    def _store_record(
+        self, record: Tuple[str, int, str, Union[int, float, bytes], int]
+    ) -> None:
+        """Store a field record, replacing any previous record for its key.
 
-    # Format type constants for better readability
-    _STRING_FORMATS = {"s"}
-    _INTEGER_FORMATS = {"b", "B", "h", "H", "i", "I", "q", "Q"}
-    _FLOAT_FORMATS = {"f", "d"}
+        Args:
+            record: Tuple of (key, key_hash, fmt, value, encoded_size)
+        """
+        key = record[0]
+        index = self._index.get(key)
+        if index is None:
+            self._index[key] = len(self._records)
+            self._records.append(record)
+        else:
+            self._records[index] = record
 
-    def _encode_field(
-        self, key_hash: int, fmt: str, value: Union[int, float, str, bytes]
-    ) -> bytes:
-        """Encode a single field into bytes.
+    def reset(self) -> None:
+        """Remove all added values so the encoder can be reused for another packet.
 
-        Dispatches to the appropriate encoding method based on format type.
+        The key map is kept, so a frozen encoder stays frozen and can take the same
+        keys again.
+        """
+        self._records.clear()
+        self._index.clear()
 
-        Args:
-            key_hash: Hash of the field key
-            fmt: Format string for the field
-            value: Value to encode
+    def encoded_size(self) -> int:
+        """Get the size of the compact binary representation.
 
         Returns:
-            Encoded field bytes
-        """
-        if self._is_string_format(fmt):
-            return self._encode_string_field(key_hash, value)
-        elif self._is_integer_format(fmt):
-            return self._encode_integer_field(key_hash, fmt, value)
-        elif self._is_float_format(fmt):
-            return self._encode_float_field(key_hash, fmt, value)
-        else:
-            raise ValueError(f"Unknown format: {fmt}")
-
-    def _is_string_format(self, fmt: str) -> bool:
-        """Check if format represents a string type."""
-        return fmt in self._STRING_FORMATS
-
-    def _is_integer_format(self, fmt: str) -> bool:
-        """Check if format represents an integer type."""
-        return fmt in self._INTEGER_FORMATS
+            Number of bytes to_bytes() or pack_into() produce
+        """
+        size = 0
+        for record in self._records:
+            size += record[4]
+        return size
 
-    def _is_float_format(self, fmt: str) -> bool:
-        """Check if format represents a float type."""
-        return fmt in self._FLOAT_FORMATS
+    def pack_into(self, buf: bytearray, offset: int = 0) -> int:
+        """Write the compact binary representation into a pre-allocated buffer.
 
-    def _encode_string_field(
-        self, key_hash: int, value: Union[int, float, str, bytes]
-    ) -> bytes:
-        """Encode a string field into bytes.
+        The output is the same as to_bytes(), without allocating a new buffer.
 
         Args:
-            key_hash: Hash of the field key
-            value: Value to encode as string
+            buf: Buffer to write into
+            offset: Offset in the buffer to start writing at
 
         Returns:
-            Encoded string field bytes
+            The number of bytes written
+
+        Raises:
+            ValueError: If the buffer is too small for the encoded data
         """
-        result = struct.pack(">IB", key_hash, 0)
-        byte_value = value if isinstance(value, bytes) else str(value).encode("utf-8")
-        result += struct.pack(">B", len(byte_value)) + byte_value
-        return result
+        size = self.encoded_size()
+        if offset + size > len(buf):
+            raise ValueError(f"Buffer too small: need {offset + size}, got {len(buf)}")
 
-    def _encode_integer_field(
-        self, key_hash: int, fmt: str, value: Union[int, float, str, bytes]
-    ) -> bytes:
-        """Encode an integer field into bytes.
+        stream = _Stream(buf, offset)
 
-        Args:
-            key_hash: Hash of the field key
-            fmt: Format string for the integer
-            value: Value to encode as integer
+        for _, key_hash, fmt, value, _ in self._records:
+            writer, field_format, type_id, header_size = _FIELD_FORMATS[fmt]
+            writer(stream, field_format, type_id, header_size, key_hash, value)
 
-        Returns:
-            Encoded integer field bytes
-        """
-        type_info = self._get_integer_type_info(fmt)
-        return struct.pack(
-            type_info["struct_format"], key_hash, type_info["type_id"], int(value)
-        )
+        return size
 
-    def _encode_float_field(
-        self, key_hash: int, fmt: str, value: Union[int, float, str, bytes]
-    ) -> bytes:
-        """Encode a float field into bytes.
+    def to_bytes(self) -> bytes:
+        """Convert the encoded data to bytes using a compact format.
 
-        Args:
-            key_hash: Hash of the field key
-            fmt: Format string for the float
-            value: Value to encode as float
+        Format: [key_hash:4][type:1][data:variable]...
 
         Returns:
-            Encoded float field bytes
+            The binary representation of all added data
         """
-        type_id = 5 if fmt == "f" else 6
-        struct_format = f">IB{fmt}"
-        return struct.pack(struct_format, key_hash, type_id, float(value))
+        if not self._records:
+            return b""
 
-    def _get_integer_type_info(self, fmt: str) -> dict:
-        """Get type information for integer formats.
+        # Size the output buffer up front so every field is packed in place
+        buf = bytearray(self.encoded_size())
+        self.pack_into(buf)
+        return bytes(buf)
 
-        Args:
-            fmt: Format string for the integer
+    def to_msgpack_bytes(self) -> bytes:
+        """Convert the encoded data to bytes using MessagePack.
+
+        Fields are keyed by their full names, so no key map is needed to decode
+        them. Use BinaryDecoder.from_msgpack_bytes() to read the result.
 
         Returns:
-            Dictionary containing type_id and struct_format
-        """
-        integer_types = {
-            "b": {"type_id": 1, "struct_format": ">IBb"},
-            "B": {"type_id": 11, "struct_format": ">IBB"},
-            "h": {"type_id": 2, "struct_format": ">IBh"},
-            "H": {"type_id": 12, "struct_format": ">IBH"},
-            "i": {"type_id": 3, "struct_format": ">IBi"},
-            "I": {"type_id": 13, "struct_format": ">IBI"},
-            "q": {"type_id": 4, "struct_format": ">IBq"},
-            "Q": {"type_id": 14, "struct_format": ">IBQ"},
-        }
-        return integer_types[fmt]
+            The MessagePack representation of all added data
+
+        Raises:
+            RuntimeError: If no msgpack module is available
+        """
+        if msgpack is None:
+            raise RuntimeError("msgpack is not available")
+
+        fields: Dict[str, Union[int, float, str]] = {}
+        for key, _, fmt, value, _ in self._records:
+            if fmt == "3":
+                unpacked = struct.unpack(_VEC3_FORMAT, value)
+                for i in range(0, 9, 3):
+                    fields[self._key_map[unpacked[i]]] = unpacked[i + 2]
+                continue
+
+            if fmt in _PAYLOAD_FORMATS:
+                value = value[_FIELD_FORMATS[fmt][3] :]
+
+            if fmt == "s":
+                value = value.decode("utf-8")
+            elif fmt == "u":
+                value = _decode_varint(value, 0)[0]
+            elif fmt == "v":
+                value = _decode_varint(value, 0)[0]
+                value = (value >> 1) ^ -(value & 1)
+            fields[key] = value
+
+        stream = io.BytesIO()
+        msgpack.pack(fields, stream)
+        return stream.getvalue()
 
 
 class BinaryDecoder:
@@ -275,23 +652,96 @@ class BinaryDecoder:
             data: The binary data to decode
             key_map: Optional mapping from hash to key name
         """
-        self._data: Dict[str, Union[int, float, str]] = {}
+        # Decoded fields stored as parallel key/value columns with a name index
+        self._keys: List[str] = []
+        self._values: List[Union[int, float, str]] = []
+        self._index: Dict[str, int] = {}
         self._key_map = key_map or {}
         self._parse(data)
 
+    @classmethod
+    def from_msgpack_bytes(cls, data: bytes) -> "BinaryDecoder":
+        """Create a decoder from data produced by BinaryEncoder.to_msgpack_bytes().
+
+        Args:
+            data: The MessagePack data to decode
+
+        Returns:
+            A decoder holding the decoded fields
+
+        Raises:
+            RuntimeError: If no msgpack module is available
+        """
+        if msgpack is None:
+            raise RuntimeError("msgpack is not available")
+
+        decoder = cls(b"")
+        for key, value in msgpack.unpack(io.BytesIO(data)).items():
+            decoder._store(key, value)
+        return decoder
+
+    @classmethod
+    def parse_bulk(
+        cls, packets: List[bytes], key_map: Optional[Dict[int, str]] = None
+    ) -> List["BinaryDecoder"]:
+        """Decode many packets that share one key map, e.g. when replaying a log.
+
+        Args:
+            packets: The binary packets to decode, in order
+            key_map: Optional mapping from hash to key name
+
+        Returns:
+            List with one decoder per packet, ready for get_column()
+        """
+        # Resolve the key map once rather than per packet
+        key_map = key_map or {}
+        return [cls(packet, key_map) for packet in packets]
+
+    @classmethod
+    def parse_fixed_schema(
+        cls,
+        data: bytes,
+        schema: CompiledSchema,
+        key_map: Optional[Dict[int, str]] = None,
+    ) -> "BinaryDecoder":
+        """Decode a packet expected to follow a compiled schema.
+
+        A packet matching the schema is unpacked with a single struct call. Any
+        other packet falls back to the regular field-by-field parse.
+
+        Args:
+            data: The binary data to decode
+            schema: The schema the packet is expected to follow
+            key_map: Optional mapping from hash to key name, used by the fallback
+
+        Returns:
+            A decoder holding the decoded fields
+        """
+        if len(data) == schema.size:
+            fields = struct.unpack_from(schema.format, data, 0)
+            if schema.matches(fields):
+                decoder = cls(b"", key_map)
+                slots = schema.slots
+                for i in range(len(slots)):
+                    decoder._store(schema.keys[i], fields[slots[i]])
+                return decoder
+
+        return cls(data, key_map)
+
     def _parse(self, data: bytes) -> None:
         """Parse the binary data."""
         if not data:
             return
 
         offset = 0
+        data_len = len(data)
 
-        while offset < len(data):
-            if offset + 5 > len(data):  # Need at least 5 bytes (4 + 1)
+        while offset < data_len:
+            if offset + 5 > data_len:  # Need at least 5 bytes (4 + 1)
                 break
 
-            # Read key hash and type
-            key_hash, data_type = struct.unpack(">IB", data[offset : offset + 5])
+            # Read key hash and type in place, without slicing the buffer
+            key_hash, data_type = struct.unpack_from(">IB", data, offset)
             offset += 5
 
             # Get key name from hash or use hash as string
@@ -301,9 +751,36 @@ class BinaryDecoder:
             if value is None:
                 break  # Failed to decode or unknown type
 
-            self._data[key_name] = value
+            self._store(key_name, value)
             offset += consumed
 
+    def _store(self, key: str, value: Union[int, float, str]) -> None:
+        """Store a decoded field, replacing any previous value for the key.
+
+        Args:
+            key: The key name
+            value: The decoded value
+        """
+        index = self._index.get(key)
+        if index is None:
+            self._index[key] = len(self._values)
+            self._keys.append(key)
+            self._values.append(value)
+        else:
+            self._values[index] = value
+
+    def _get(self, key: str) -> Union[int, float, str, None]:
+        """Get a decoded value.
+
+        Args:
+            key: The key name
+
+        Returns:
+            The decoded value or None if not found
+        """
+        index = self._index.get(key)
+        return self._values[index] if index is not None else None
+
     def _decode_field(
         self, data: bytes, offset: int, data_type: int
     ) -> Tuple[Union[int, float, str, None], int]:
@@ -320,7 +797,7 @@ class BinaryDecoder:
         if data_type == 0:  # String
             if offset + 1 > len(data):
                 return None, 0
-            str_len = struct.unpack(">B", data[offset : offset + 1])[0]
+            str_len = data[offset]
             offset += 1
 
             if offset + str_len > len(data):
@@ -328,25 +805,17 @@ class BinaryDecoder:
             value = data[offset : offset + str_len].decode("utf-8")
             return value, 1 + str_len
 
-        # Define format mappings for numeric types with separate signed/unsigned
-        type_formats = {
-            1: (">b", 1),  # 1-byte signed int
-            2: (">h", 2),  # 2-byte signed int
-            3: (">i", 4),  # 4-byte signed int
-            4: (">q", 8),  # 8-byte signed int
-            5: (">f", 4),  # 4-byte float
-            6: (">d", 8),  # 8-byte float
-            11: (">B", 1),  # 1-byte unsigned int
-            12: (">H", 2),  # 2-byte unsigned int
-            13: (">I", 4),  # 4-byte unsigned int
-            14: (">Q", 8),  # 8-byte unsigned int
-        }
+        if data_type == 20 or data_type == 21:  # Zigzag or unsigned varint
+            value, consumed = _decode_varint(data, offset)
+            if value is not None and data_type == 20:
+                value = (value >> 1) ^ -(value & 1)
+            return value, consumed
 
-        if data_type in type_formats:
-            fmt, size = type_formats[data_type]
+        if data_type in _VALUE_FORMATS:
+            fmt, size = _VALUE_FORMATS[data_type]
             if offset + size > len(data):
                 return None, 0
-            value = struct.unpack(fmt, data[offset : offset + size])[0]
+            value = struct.unpack_from(fmt, data, offset)[0]
             return value, size
         else:
             # Unknown type
@@ -361,7 +830,7 @@ class BinaryDecoder:
         Returns:
             The integer value or None if not found
         """
-        value = self._data.get(key)
+        value = self._get(key)
         return int(value) if value is not None else None
 
     def get_float(self, key: str) -> Optional[float]:
@@ -373,7 +842,7 @@ class BinaryDecoder:
         Returns:
             The float value or None if not found
         """
-        value = self._data.get(key)
+        value = self._get(key)
         return float(value) if value is not None else None
 
     def get_string(self, key: str) -> Optional[str]:
@@ -385,7 +854,7 @@ class BinaryDecoder:
         Returns:
             The string value or None if not found
         """
-        value = self._data.get(key)
+        value = self._get(key)
         return str(value) if value is not None else None
 
     def get_all(self) -> Dict[str, Union[int, float, str]]:
@@ -394,4 +863,22 @@ class BinaryDecoder:
         Returns:
             Dictionary containing all decoded key-value pairs
         """
-        return self._data.copy()
+        return dict(zip(self._keys, self._values))
+
+    @staticmethod
+    def get_column(
+        key: str, decoders: List["BinaryDecoder"]
+    ) -> List[Union[int, float, str, None]]:
+        """Get one field's values across many decoded packets.
+
+        Args:
+            key: The key name
+            decoders: Decoders of the packets, in order
+
+        Returns:
+            List with the field's value from each packet, or None where missing
+        """
+        column: List[Union[int, float, str, None]] = [None] * len(decoders)
+        for i in range(len(decoders)):
+            column[i] = decoders[i]._get(key)
+        return column
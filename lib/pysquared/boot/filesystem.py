@@ -9,6 +9,7 @@ import storage
 def mkdir(
     path: str,
     storage_action_delay: float = 0.02,
+    debug: bool = False,
 ) -> None:
     """
     Create directories on internal storage during boot.
@@ -20,7 +21,8 @@ def mkdir(
 
     Args:
         mount_point: Path to mount point
-        storage_action_delay: Delay after storage actions to ensure stability
+        storage_action_delay: Delay after the storage sequence to ensure stability
+        debug: Print each storage step to the console
 
     Usage:
         ```python
@@ -28,22 +30,27 @@ def mkdir(
         mkdir("/sd")
         ```
     """
+    # The storage calls block until they complete, so a single delay once the USB
+    # drive is re-enabled is enough to let the filesystem settle
     try:
         storage.disable_usb_drive()
-        time.sleep(storage_action_delay)
-        print("Disabled USB drive")
+        if debug:
+            print("Disabled USB drive")
 
         storage.remount("/", False)
-        time.sleep(storage_action_delay)
-        print("Remounted root filesystem")
+        if debug:
+            print("Remounted root filesystem")
 
         try:
             os.mkdir(path)
-            print(f"Mount point {path} created.")
+            if debug:
+                print(f"Mount point {path} created.")
         except OSError:
-            print(f"Mount point {path} already exists.")
+            if debug:
+                print(f"Mount point {path} already exists.")
 
     finally:
         storage.enable_usb_drive()
         time.sleep(storage_action_delay)
-        print("Enabled USB drive")
+        if debug:
+            print("Enabled USB drive")
@@ -15,17 +15,67 @@ cdh.listen_for_commands(timeout=60)
 ```
 """
 
+import io
 import json
 import random
 import time
-import traceback
 
 import microcontroller
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 from .config.config import Config
 from .hardware.radio.packetizer.packet_manager import PacketManager
 from .logger import Logger
 
+try:
+    from typing import Callable
+except ImportError:
+    pass
+
+
+def _constant_time_equals(a: bytes, b: bytes) -> bool:
+    """Compares two byte strings in time independent of where they differ.
+
+    Args:
+        a: The first byte string.
+        b: The second byte string.
+
+    Returns:
+        True if the byte strings are equal.
+    """
+    if len(a) != len(b):
+        return False
+
+    result = 0
+    for x, y in zip(a, b):
+        result |= x ^ y
+    return result == 0
+
+
+def _truncate_utf8(data: bytes, limit: int) -> bytes:
+    """Truncates UTF-8 text to at most limit bytes without splitting a character.
+
+    Args:
+        data: The UTF-8 encoded text.
+        limit: The maximum length in bytes.
+
+    Returns:
+        The longest prefix of data that fits in limit bytes and ends on a character
+        boundary.
+    """
+    if len(data) <= limit:
+        return data
+
+    # Back up over continuation bytes (0b10xxxxxx) to the start of the cut character
+    end = limit
+    while end > 0 and data[end] & 0xC0 == 0x80:
+        end -= 1
+    return data[:end]
+
 
 class CommandDataHandler:
     """Handles command parsing, validation, and execution for the satellite."""
@@ -54,6 +104,13 @@ class CommandDataHandler:
         self._packet_manager: PacketManager = packet_manager
         self._send_delay: float = send_delay
 
+        # Command name -> handler taking the command args, built once
+        self._dispatch: dict[str, Callable[[list[str]], None]] = {
+            self.command_reset: lambda args: self.reset(),
+            self.command_change_radio_modulation: self.change_radio_modulation,
+            self.command_send_joke: lambda args: self.send_joke(),
+        }
+
     def listen_for_commands(self, timeout: int) -> None:
         """Listens for commands from the radio and handles them.
 
@@ -62,17 +119,26 @@ class CommandDataHandler:
         """
         self._log.debug("Listening for commands...", timeout=timeout)
 
-        json_bytes = self._packet_manager.listen(timeout)
-        if json_bytes is None:
+        data = self._packet_manager.listen(timeout)
+        if data is None:
             return
 
-        try:
-            json_str = json_bytes.decode("utf-8")
+        # Reject MessagePack frames addressed to another satellite before spending
+        # time decoding them, since they carry the name as plain UTF-8. JSON may
+        # escape non-ASCII names, so JSON frames are checked after decoding.
+        if data[:1] != b"{" and self._config.cubesat_name.encode("utf-8") not in data:
+            self._log.debug("Satellite name not found in message")
+            return
 
-            msg: dict[str, str] = json.loads(json_str)
+        try:
+            msg: dict[str, str] = self._decode_message(data)
 
             # If message has password field, check it
-            if msg.get("password") != self._config.super_secret_code:
+            password = msg.get("password")
+            if not isinstance(password, str) or not _constant_time_equals(
+                password.encode("utf-8"),
+                self._config.super_secret_code.encode("utf-8"),
+            ):
                 self._log.debug(
                     "Invalid password in message",
                     msg=msg,
@@ -106,27 +172,51 @@ class CommandDataHandler:
             time.sleep(self._send_delay)
             self._packet_manager.send_acknowledgement()
 
-            if cmd == self.command_reset:
-                self.reset()
-            elif cmd == self.command_change_radio_modulation:
-                self.change_radio_modulation(args)
-            elif cmd == self.command_send_joke:
-                self.send_joke()
-            else:
+            handler = self._dispatch.get(cmd)
+            if handler is None:
                 self._log.warning("Unknown command received", cmd=cmd)
                 self._packet_manager.send(
                     f"Unknown command received: {cmd}".encode("utf-8")
                 )
+            else:
+                handler(args)
 
         except Exception as e:
+            # The logger keeps the full traceback locally, only a short summary
+            # is worth the radio time. Truncate the encoded bytes so non-ASCII
+            # messages still fit in 64 bytes and stay valid UTF-8.
             self._log.error("Failed to process command message", err=e)
             self._packet_manager.send(
-                f"Failed to process command message: {traceback.format_exception(e)}".encode(
-                    "utf-8"
-                )
+                _truncate_utf8(f"ERR:{type(e).__name__}:{e}".encode("utf-8"), 64)
             )
             return
 
+    @staticmethod
+    def _decode_message(data: bytes) -> dict:
+        """Decodes a command message.
+
+        Messages are MessagePack maps. Legacy ground stations send JSON objects,
+        which are recognised by their leading "{" since a MessagePack map never
+        starts with that byte.
+
+        Args:
+            data: The raw message bytes.
+
+        Returns:
+            The decoded message.
+
+        Raises:
+            ValueError: If the message does not decode to a map.
+        """
+        if msgpack is None or data[:1] == b"{":
+            msg = json.loads(data.decode("utf-8"))
+        else:
+            msg = msgpack.unpack(io.BytesIO(data))
+
+        if not isinstance(msg, dict):
+            raise ValueError("Command message is not a map")
+        return msg
+
     def send_joke(self) -> None:
         """Sends a random joke from the config."""
         joke = random.choice(self._config.jokes)
@@ -10,13 +10,141 @@ Classes:
 ```python
 config = Config("config.json")
 config.update_config("cubesat_name", "Cube1", temporary=False)
+
+# Batch several permanent updates into a single write
+with Config("config.json", autoflush=False) as config:
+    config.update_config("cubesat_name", "Cube1", temporary=False)
+    config.update_config("sleep_duration", 60, temporary=False)
 ```
 """
 
 import json
+import os
 
 from .radio import RadioConfig
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# CircuitPython's os has no file descriptor functions, so it reads through open()
+# and writes without fsync
+_FD_IO = hasattr(os, "open") and hasattr(os, "fstat") and hasattr(os, "fsync")
+
+
+def _read_file(path: str) -> bytes:
+    """
+    Reads a whole file through a file descriptor, skipping the buffered file object.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        bytes: The file contents.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # a regular file is normally read in one call, keep reading if it wasn't
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def _load_json(path: str) -> dict:
+    """
+    Reads and parses a JSON file, recovering from an interrupted _dump_json().
+
+    If the file is missing or doesn't parse, the temporary file _dump_json() writes
+    is used instead. Without os.replace the original is removed before the
+    temporary file is renamed over it, so a power loss between the two leaves the
+    only complete copy in the temporary file.
+
+    Args:
+        path (str): Path to the JSON file.
+
+    Returns:
+        dict: The parsed JSON data.
+
+    Raises:
+        OSError: If neither file can be read.
+        ValueError: If neither file is valid JSON.
+    """
+    try:
+        return _parse_json_file(path)
+    except (OSError, ValueError) as e:
+        error = e
+
+    try:
+        return _parse_json_file(path + ".tmp")
+    except (OSError, ValueError):
+        raise error
+
+
+def _parse_json_file(path: str) -> dict:
+    """
+    Reads and parses a JSON file, with orjson when it is available.
+
+    Args:
+        path (str): Path to the JSON file.
+
+    Returns:
+        dict: The parsed JSON data.
+    """
+    if not _FD_IO:
+        with open(path, "r") as f:
+            return json.loads(f.read())
+
+    data = _read_file(path)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(path: str, data: dict) -> None:
+    """
+    Serializes data and writes it to a JSON file, with orjson when it is available.
+
+    The data is written to a temporary file that then replaces the original, so a
+    crash mid-write can't leave a truncated config behind.
+
+    Args:
+        path (str): Path to the JSON file.
+        data (dict): The data to write.
+    """
+    # Serialize before opening so a value that can't be serialized leaves the file
+    # untouched
+    if orjson is not None:
+        # orjson serializes straight to UTF-8 bytes
+        encoded = orjson.dumps(data)
+    else:
+        encoded = json.dumps(data).encode("utf-8")
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(encoded)
+        if _FD_IO:
+            f.flush()
+            os.fsync(f.fileno())
+
+    if hasattr(os, "replace"):
+        os.replace(tmp_path, path)
+        return
+
+    # CircuitPython has no os.replace and can't rename onto an existing file
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+    os.rename(tmp_path, path)
+
 
 class Config:
     """
@@ -29,6 +157,7 @@ class Config:
 
     Attributes:
         config_file (str): Path to the configuration JSON file.
+        autoflush (bool): Write permanent updates to the file immediately.
         radio (RadioConfig): Radio configuration handler.
         cubesat_name (str): Name of the cubesat.
         sleep_duration (int): Sleep duration in seconds.
@@ -58,14 +187,41 @@ class Config:
             Saves a configuration value to the JSON file.
         update_config(key, value, temporary):
             Updates a configuration value, either temporarily or permanently.
+        flush():
+            Writes pending permanent updates to the JSON file.
     """
 
-    def __init__(self, config_path: str) -> None:
+    CONFIG_SCHEMA = {
+        "cubesat_name": {"type": str, "min_length": 1, "max_length": 10},
+        "super_secret_code": {"type": bytes, "min": 1, "max": 24},
+        "repeat_code": {"type": bytes, "min": 1, "max": 4},
+        "normal_charge_current": {"type": float, "min": 0.0, "max": 2000.0},
+        "normal_battery_voltage": {"type": float, "min": 6.0, "max": 8.4},
+        "degraded_battery_voltage": {"type": float, "min": 5.4, "max": 8.0},
+        "critical_battery_voltage": {"type": float, "min": 5.4, "max": 7.2},
+        "sleep_duration": {"type": int, "min": 1, "max": 86400},
+        "normal_temp": {"type": int, "min": 5, "max": 40},
+        "normal_battery_temp": {"type": int, "min": 1, "max": 35},
+        "normal_micro_temp": {"type": int, "min": 1, "max": 50},
+        "reboot_time": {"type": int, "min": 3600, "max": 604800},
+        "detumble_enable_z": {"type": bool},
+        "detumble_enable_x": {"type": bool},
+        "detumble_enable_y": {"type": bool},
+        "debug": {"type": bool},
+        "heating": {"type": bool},
+        "turbo_clock": {"type": bool},
+    }
+
+    def __init__(self, config_path: str, autoflush: bool = True) -> None:
         """
         Initializes the Config object by loading values from the given JSON file.
 
         Args:
             config_path (str): Path to the configuration JSON file.
+            autoflush (bool): If True, every permanent update is written to the file
+                immediately. If False, permanent updates are kept in RAM until
+                flush() is called or the Config is used as a context manager and
+                the with block exits.
 
         Raises:
             FileNotFoundError: If the configuration file does not exist.
@@ -73,9 +229,12 @@ class Config:
         """
 
         self.config_file = config_path
+        self.autoflush: bool = autoflush
+        self._dirty: bool = False
         # parses json & assigns data to variables
-        with open(self.config_file, "r") as f:
-            json_data = json.loads(f.read())
+        json_data = _load_json(self.config_file)
+        # Permanent updates edit this copy and write it back, without re-reading
+        self._json_cache: dict = json_data
 
         self.radio: RadioConfig = RadioConfig(json_data["radio"])
         self.cubesat_name: str = json_data["cubesat_name"]
@@ -101,27 +260,6 @@ class Config:
             "longest_allowable_sleep_time"
         ]
 
-        self.CONFIG_SCHEMA = {
-            "cubesat_name": {"type": str, "min_length": 1, "max_length": 10},
-            "super_secret_code": {"type": bytes, "min": 1, "max": 24},
-            "repeat_code": {"type": bytes, "min": 1, "max": 4},
-            "normal_charge_current": {"type": float, "min": 0.0, "max": 2000.0},
-            "normal_battery_voltage": {"type": float, "min": 6.0, "max": 8.4},
-            "degraded_battery_voltage": {"type": float, "min": 5.4, "max": 8.0},
-            "critical_battery_voltage": {"type": float, "min": 5.4, "max": 7.2},
-            "sleep_duration": {"type": int, "min": 1, "max": 86400},
-            "normal_temp": {"type": int, "min": 5, "max": 40},
-            "normal_battery_temp": {"type": int, "min": 1, "max": 35},
-            "normal_micro_temp": {"type": int, "min": 1, "max": 50},
-            "reboot_time": {"type": int, "min": 3600, "max": 604800},
-            "detumble_enable_z": {"type": bool},
-            "detumble_enable_x": {"type": bool},
-            "detumble_enable_y": {"type": bool},
-            "debug": {"type": bool},
-            "heating": {"type": bool},
-            "turbo_clock": {"type": bool},
-        }
-
     # validates values from input
     def validate(self, key: str, value) -> None:
         """
@@ -171,13 +309,75 @@ class Config:
             value: The value to save.
         """
 
-        with open(self.config_file, "r") as f:
-            json_data = json.loads(f.read())
+        self._write_cached(self._json_cache, key, value)
+
+    def _write_cached(self, section: dict, key: str, value) -> None:
+        """
+        Sets a value in the cached JSON data and writes the data to the file.
+
+        If the data can't be written, the previous cached value is restored. Without
+        autoflush the write is left for flush().
+
+        Args:
+            section (dict): The part of the cached JSON data holding the key.
+            key (str): The configuration key to save.
+            value: The value to save.
+        """
+
+        had_key = key in section
+        previous = section.get(key)
+        section[key] = value
+        if not self.autoflush:
+            self._dirty = True
+            return
+
+        try:
+            _dump_json(self.config_file, self._json_cache)
+        except Exception:
+            if had_key:
+                section[key] = previous
+            else:
+                del section[key]
+            raise
+
+    def flush(self) -> None:
+        """
+        Writes pending permanent updates to the JSON file.
+
+        Does nothing if there are no pending updates.
+        """
+
+        if not self._dirty:
+            return
+
+        _dump_json(self.config_file, self._json_cache)
+        self._dirty = False
+
+    def __enter__(self) -> "Config":
+        """
+        Enters a context in which the Config can be updated.
+
+        Returns:
+            Config: This Config object.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Writes pending permanent updates when the context exits without an error.
 
-        json_data[key] = value
+        If the with block raised, a partly applied batch is not written to the file.
+        The pending updates are only written by a later explicit flush().
 
-        with open(self.config_file, "w") as f:
-            f.write(json.dumps(json_data))
+        Args:
+            exc_type: The exception type, if an exception was raised.
+            exc_value: The exception, if one was raised.
+            traceback: The traceback, if an exception was raised.
+        """
+
+        if exc_type is None:
+            self.flush()
 
     # handles temp or permanent updates
     def update_config(self, key: str, value, temporary: bool) -> None:
@@ -205,22 +405,15 @@ class Config:
         else:
             # Delegate radio-related validation to RadioConfig
             self.radio.validate(key, value)
+            section = self.radio.get_section(key)
             # if permanent, saves to config
             if not temporary:
-                with open(self.config_file, "r") as f:
-                    json_data = json.loads(f.read())
-                if key in self.radio.RADIO_SCHEMA:
-                    json_data["radio"][key] = value
-                elif key in self.radio.fsk.FSK_SCHEMA:
-                    json_data["radio"]["fsk"][key] = value
-                else:  # key is in self.radio.lora.LORA_SCHEMA
-                    json_data["radio"]["lora"][key] = value
-                with open(self.config_file, "w") as f:
-                    f.write(json.dumps(json_data))
+                section_data = self._json_cache["radio"]
+                if section != "radio":
+                    section_data = section_data[section]
+                self._write_cached(section_data, key, value)
             # updates RAM
-            if key in self.radio.RADIO_SCHEMA:
+            if section == "radio":
                 setattr(self.radio, key, value)
-            elif key in self.radio.fsk.FSK_SCHEMA:
-                setattr(self.radio.fsk, key, value)
-            else:  # key is in self.radio.lora.LORA_SCHEMA
-                setattr(self.radio.lora, key, value)
+            else:
+                setattr(getattr(self.radio, section), key, value)
@@ -29,8 +29,23 @@ class RadioConfig:
     Methods:
         validate(key, value):
             Validates a radio configuration value against its schema.
+        get_section(key):
+            Returns the name of the configuration section holding a key.
     """
 
+    RADIO_SCHEMA = {
+        "license": {"type": str},
+        "modulation": {"type": str, "allowed_values": ["LoRa", "FSK"]},
+        "start_time": {"type": int, "min": 0, "max": 80000},
+        "transmit_frequency": {
+            "type": (int, float),
+            "min0": 435,
+            "max0": 438.0,
+            "min1": 915.0,
+            "max1": 915.0,
+        },
+    }
+
     def __init__(self, radio_dict: dict) -> None:
         """
         Initializes the RadioConfig object with values from a dictionary.
@@ -46,18 +61,18 @@ class RadioConfig:
         self.fsk: FSKConfig = FSKConfig(radio_dict["fsk"])
         self.lora: LORAConfig = LORAConfig(radio_dict["lora"])
 
-        self.RADIO_SCHEMA = {
-            "license": {"type": str},
-            "modulation": {"type": str, "allowed_values": ["LoRa", "FSK"]},
-            "start_time": {"type": int, "min": 0, "max": 80000},
-            "transmit_frequency": {
-                "type": (int, float),
-                "min0": 435,
-                "max0": 438.0,
-                "min1": 915.0,
-                "max1": 915.0,
-            },
-        }
+        # every radio key's schema and section, so each lookup is a single dict access
+        self._schemas: dict = {}
+        self._sections: dict = {}
+        for section, section_schema in (
+            ("radio", self.RADIO_SCHEMA),
+            ("fsk", self.fsk.FSK_SCHEMA),
+            ("lora", self.lora.LORA_SCHEMA),
+        ):
+            for key, schema in section_schema.items():
+                if key not in self._schemas:
+                    self._schemas[key] = schema
+                    self._sections[key] = section
 
     def validate(self, key: str, value) -> None:
         """
@@ -73,13 +88,8 @@ class RadioConfig:
             ValueError: If the value is out of the allowed range.
         """
 
-        if key in self.RADIO_SCHEMA:
-            schema = self.RADIO_SCHEMA[key]
-        elif key in self.fsk.FSK_SCHEMA:
-            schema = self.fsk.FSK_SCHEMA[key]
-        elif key in self.lora.LORA_SCHEMA:
-            schema = self.lora.LORA_SCHEMA[key]
-        else:
+        schema = self._schemas.get(key)
+        if schema is None:
             raise KeyError
 
         if "allowed_values" in schema:
@@ -113,6 +123,23 @@ class RadioConfig:
                 ):
                     raise ValueError
 
+    def get_section(self, key: str) -> str:
+        """
+        Returns the name of the configuration section holding a radio key.
+
+        Args:
+            key (str): The radio configuration key.
+
+        Returns:
+            str: "radio" for top-level radio keys, "fsk" or "lora" for keys of
+            those sections.
+
+        Raises:
+            KeyError: If the key is not found in any schema.
+        """
+
+        return self._sections[key]
+
 
 class FSKConfig:
     """
@@ -125,6 +152,12 @@ class FSKConfig:
         FSK_SCHEMA (dict): Validation schema for FSK configuration keys.
     """
 
+    FSK_SCHEMA = {
+        "broadcast_address": {"type": int, "min": 0, "max": 255},
+        "node_address": {"type": int, "min": 0, "max": 255},
+        "modulation_type": {"type": int, "min": 0, "max": 1},
+    }
+
     def __init__(self, fsk_dict: dict) -> None:
         """
         Initializes the FSKConfig object with values from a dictionary.
@@ -137,12 +170,6 @@ class FSKConfig:
         self.node_address: int = fsk_dict["node_address"]
         self.modulation_type: int = fsk_dict["modulation_type"]
 
-        self.FSK_SCHEMA = {
-            "broadcast_address": {"type": int, "min": 0, "max": 255},
-            "node_address": {"type": int, "min": 0, "max": 255},
-            "modulation_type": {"type": int, "min": 0, "max": 1},
-        }
-
 
 class LORAConfig:
     """
@@ -157,6 +184,15 @@ class LORAConfig:
         LORA_SCHEMA (dict): Validation schema for LoRa configuration keys.
     """
 
+    LORA_SCHEMA = {
+        "ack_delay": {"type": float, "min": 0.0, "max": 2.0},
+        "coding_rate": {"type": int, "min": 4, "max": 8},
+        "cyclic_redundancy_check": {"type": bool, "allowed_values": [True, False]},
+        "max_output": {"type": bool, "allowed_values": [True, False]},
+        "spreading_factor": {"type": int, "min": 6, "max": 12},
+        "transmit_power": {"type": int, "min": 5, "max": 23},
+    }
+
     def __init__(self, lora_dict: dict) -> None:
         """
         Initializes the LORAConfig object with values from a dictionary.
@@ -172,12 +208,3 @@ class LORAConfig:
             "spreading_factor"
         ]
         self.transmit_power: int = lora_dict["transmit_power"]
-
-        self.LORA_SCHEMA = {
-            "ack_delay": {"type": float, "min": 0.0, "max": 2.0},
-            "coding_rate": {"type": int, "min": 4, "max": 8},
-            "cyclic_redundancy_check": {"type": bool, "allowed_values": [True, False]},
-            "max_output": {"type": bool, "allowed_values": [True, False]},
-            "spreading_factor": {"type": int, "min": 6, "max": 12},
-            "transmit_power": {"type": int, "min": 5, "max": 23},
-        }
@@ -2,6 +2,13 @@
 Includes vector math utilities and the main dipole calculation for attitude control.
 """
 
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def dot_product(vector1: tuple, vector2: tuple) -> float:
     """
@@ -14,10 +21,10 @@ def dot_product(vector1: tuple, vector2: tuple) -> float:
     Returns:
         float: The dot product of the two vectors.
     """
-    return sum([a * b for a, b in zip(vector1, vector2)])
+    return vector1[0] * vector2[0] + vector1[1] * vector2[1] + vector1[2] * vector2[2]
 
 
-def x_product(vector1: tuple, vector2: tuple) -> list:
+def x_product(vector1: tuple, vector2: tuple) -> tuple:
     """
     Computes the cross product of two 3-element vectors.
 
@@ -26,13 +33,13 @@ def x_product(vector1: tuple, vector2: tuple) -> list:
         vector2 (tuple): Second vector (length 3).
 
     Returns:
-        list: The cross product vector (length 3).
+        tuple: The cross product vector (length 3).
     """
-    return [
+    return (
         vector1[1] * vector2[2] - vector1[2] * vector2[1],
-        vector1[0] * vector2[2] - vector1[2] * vector2[0],
+        vector1[2] * vector2[0] - vector1[0] * vector2[2],
         vector1[0] * vector2[1] - vector1[1] * vector2[0],
-    ]
+    )
 
 
 def gain_func() -> float:
@@ -45,7 +52,7 @@ def gain_func() -> float:
     return 1.0
 
 
-def magnetorquer_dipole(mag_field: tuple, ang_vel: tuple) -> list:
+def magnetorquer_dipole(mag_field: tuple, ang_vel: tuple) -> tuple:
     """
     Calculates the required dipole moment for the magnetorquers to detumble the satellite.
 
@@ -54,11 +61,41 @@ def magnetorquer_dipole(mag_field: tuple, ang_vel: tuple) -> list:
         ang_vel (tuple): The measured angular velocity vector (length 3).
 
     Returns:
-        list: The dipole moment vector to be applied (length 3).
+        tuple: The dipole moment vector to be applied (length 3).
+    """
+    bx, by, bz = mag_field
+    wx, wy, wz = ang_vel
+
+    # B x w scaled by -gain / |B|, with the magnitude and cross product inlined
+    scalar_coef = -gain_func() / math.sqrt(bx * bx + by * by + bz * bz)
+    return (
+        (by * wz - bz * wy) * scalar_coef,
+        (bz * wx - bx * wz) * scalar_coef,
+        (bx * wy - by * wx) * scalar_coef,
+    )
+
+
+def magnetorquer_dipole_batch(mag_fields, ang_vels):
+    """
+    Calculates the detumble dipole moments for many samples at once.
+
+    Gives the same result as calling magnetorquer_dipole() on every sample, for
+    processing recorded telemetry on a host with NumPy.
+
+    Args:
+        mag_fields (numpy.ndarray): Measured magnetic field vectors, shape (N, 3).
+        ang_vels (numpy.ndarray): Measured angular velocity vectors, shape (N, 3).
+
+    Returns:
+        numpy.ndarray: The dipole moment vectors to be applied, shape (N, 3).
+
+    Raises:
+        RuntimeError: If NumPy is not available.
     """
-    gain = gain_func()
-    scalar_coef = -gain / pow(dot_product(mag_field, mag_field), 0.5)
-    dipole_out = x_product(mag_field, ang_vel)
-    for i in range(3):
-        dipole_out[i] *= scalar_coef
-    return dipole_out
+    if numpy is None:
+        raise RuntimeError("numpy is not available")
+
+    mag_fields = numpy.asarray(mag_fields, dtype=float)
+    ang_vels = numpy.asarray(ang_vels, dtype=float)
+    scalar_coef = -gain_func() / numpy.linalg.norm(mag_fields, axis=1, keepdims=True)
+    return numpy.cross(mag_fields, ang_vels) * scalar_coef
@@ -87,23 +87,16 @@ class BurnwireManager(BurnwireProto):
 
         This method sets the `_enable_burn` and `_fire_burn` pins to the logic level specified by `_enable_logic`.
         It first enables the burnwire circuit, waits briefly to allow load switches to stabilize, and then fires the burnwire.
-        Raises a RuntimeError if setting either pin fails.
-
-        Raises:
-            RuntimeError: If unable to set the enable or fire pins due to hardware or communication errors.
+        The pins are written directly to keep the fire pulse timing tight; pin write errors propagate to the caller.
         """
-        try:
-            self._enable_burn.value = self._enable_logic
-        except Exception as e:
-            raise RuntimeError("Failed to set enable_burn pin") from e
+        enable_logic = self._enable_logic
+
+        self._enable_burn.value = enable_logic
 
         time.sleep(0.1)  # Short pause to stabilize load switches
 
         # Burnwire becomes active
-        try:
-            self._fire_burn.value = self._enable_logic
-        except Exception as e:
-            raise RuntimeError("Failed to set fire_burn pin") from e
+        self._fire_burn.value = enable_logic
 
     def _disable(self):
         """
@@ -111,17 +104,13 @@ class BurnwireManager(BurnwireProto):
 
         Sets the `_fire_burn` and `_enable_burn` pin values to the logical opposite of `_enable_logic`,
         effectively disabling the burnwire mechanism. Logs the action for traceability.
-        Raises a RuntimeError if the operation fails.
-
-        Raises:
-            RuntimeError: If unable to set the burnwire pins to the safe state.
+        Pin write errors propagate to the caller.
         """
-        try:
-            self._fire_burn.value = not self._enable_logic
-            self._enable_burn.value = not self._enable_logic
-            self._log.debug("Burnwire safed")
-        except Exception as e:
-            raise RuntimeError("Failed to safe burnwire pins") from e
+        safe_logic = not self._enable_logic
+
+        self._fire_burn.value = safe_logic
+        self._enable_burn.value = safe_logic
+        self._log.debug("Burnwire safed")
 
     def _attempt_burn(self, duration: float = 5.0) -> None:
         """Attempts to actuate the burnwire for a set period of time.
@@ -140,7 +129,7 @@ class BurnwireManager(BurnwireProto):
             try:
                 self._enable()
             except Exception as e:
-                error = RuntimeError("Failed to set fire_burn pin")
+                error = RuntimeError("Burnwire pin write failed")
                 raise error from e
 
             time.sleep(duration)
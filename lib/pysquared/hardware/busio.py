@@ -117,18 +117,20 @@ def _spi_configure(
     """
     logger.debug("Configuring spi bus")
 
-    baudrate = baudrate if baudrate else 100000
-    phase = phase if phase else 0
-    polarity = polarity if polarity else 0
-    bits = bits if bits else 8
-
-    # Mirroring how tca multiplexer initializes the i2c bus with lock retries
-    tries = 0
-    while not spi.try_lock():
-        if tries >= 200:
-            raise RuntimeError("Unable to lock spi bus.")
-        tries += 1
-        time.sleep(0)
+    # Callers may pass None explicitly, fall back to the defaults for those
+    baudrate = baudrate or 100000
+    phase = phase or 0
+    polarity = polarity or 0
+    bits = bits or 8
+
+    # Mirroring how tca multiplexer initializes the i2c bus with lock retries. The
+    # first few retries only yield, later ones sleep briefly instead of spinning.
+    for tries in range(200):
+        if spi.try_lock():
+            break
+        time.sleep(0 if tries < 4 else 0.0005)
+    else:
+        raise RuntimeError("Unable to lock spi bus.")
 
     try:
         spi.configure(baudrate=baudrate, phase=phase, polarity=polarity, bits=bits)
@@ -19,7 +19,7 @@ def initialize_pin(
         logger (Logger): The logger instance to log messages.
         pin (Pin): The pin to initialize.
         direction (Direction): The direction of the pin.
-        initial_value (bool): The initial value of the pin (default is True).
+        initial_value (bool): The initial value of the pin. Ignored for input pins.
 
     Raises:
         HardwareInitializationError: If the pin fails to initialize.
@@ -31,8 +31,11 @@ def initialize_pin(
 
     try:
         digital_in_out = DigitalInOut(pin)
-        digital_in_out.direction = direction
-        digital_in_out.value = initial_value
+        # Set direction and value in a single call rather than separate attribute writes
+        if direction == Direction.OUTPUT:
+            digital_in_out.switch_to_output(value=initial_value)
+        else:
+            digital_in_out.switch_to_input()
         return digital_in_out
     except Exception as e:
         raise HardwareInitializationError("Failed to initialize pin") from e
@@ -9,10 +9,17 @@ i2c = busio.I2C(board.SCL, board.SDA)
 imu = LSM6DSOXManager(logger, i2c, 0x6A)
 angular_velocity = imu.get_angular_velocity()
 accel_data = imu.get_acceleration()
+accel_data, angular_velocity = imu.get_imu_reading(max_age_ms=10)
+imu.configure_fifo(odr=104, watermark=32)
+samples = imu.drain_fifo()
 temp_data = imu.get_temperature()
 ```
 """
 
+import math
+import struct
+import time
+
 from adafruit_lsm6ds.lsm6dsox import LSM6DSOX
 from busio import I2C
 
@@ -21,12 +28,52 @@ from ....protos.imu import IMUProto
 from ....protos.temperature_sensor import TemperatureSensorProto
 from ....sensor_reading.acceleration import Acceleration
 from ....sensor_reading.angular_velocity import AngularVelocity
+from ....sensor_reading.base import Reading
 from ....sensor_reading.error import (
     SensorReadingUnknownError,
 )
 from ....sensor_reading.temperature import Temperature
 from ...exception import HardwareInitializationError
 
+try:
+    from typing import Dict, List, Optional, Tuple, Union
+except ImportError:
+    pass
+
+# Gyro x/y/z output registers, immediately followed by accelerometer x/y/z
+_OUTX_L_G = 0x22
+_GYRO_ACCEL_FORMAT = "<hhhhhh"
+_GYRO_ACCEL_SIZE = 12
+
+# FIFO control, status and output registers
+_FIFO_CTRL1 = 0x07  # Watermark bits 7:0
+_FIFO_CTRL2 = 0x08  # Watermark bit 8
+_FIFO_CTRL3 = 0x09  # Gyro batch data rate 7:4, accelerometer batch data rate 3:0
+_FIFO_CTRL4 = 0x0A  # FIFO mode 2:0
+_FIFO_STATUS1 = 0x3A  # Unread entries bits 7:0, bits 9:8 follow in FIFO_STATUS2
+_FIFO_DATA_OUT_TAG = 0x78  # Tag byte followed by x/y/z, wraps back after z
+
+_FIFO_MODE_BYPASS = 0b000
+_FIFO_MODE_CONTINUOUS = 0b110
+_FIFO_TAG_GYRO = 0x01
+_FIFO_TAG_ACCEL = 0x02
+_FIFO_ENTRY_SIZE = 7
+_FIFO_MAX_ENTRIES = 511
+
+# Batch data rate in Hz -> FIFO_CTRL3 code
+_FIFO_BDR = {
+    12.5: 0b0001,
+    26: 0b0010,
+    52: 0b0011,
+    104: 0b0100,
+    208: 0b0101,
+    417: 0b0110,
+    833: 0b0111,
+    1667: 0b1000,
+    3333: 0b1001,
+    6667: 0b1010,
+}
+
 
 class LSM6DSOXManager(IMUProto, TemperatureSensorProto):
     """Manages the LSM6DSOX IMU."""
@@ -36,6 +83,7 @@ class LSM6DSOXManager(IMUProto, TemperatureSensorProto):
         logger: Logger,
         i2c: I2C,
         address: int,
+        cache_ttl_ms: float = 5,
     ) -> None:
         """Initializes the LSM6DSOXManager.
 
@@ -43,6 +91,8 @@ class LSM6DSOXManager(IMUProto, TemperatureSensorProto):
             logger: The logger to use.
             i2c: The I2C bus connected to the chip.
             address: The I2C address of the IMU.
+            cache_ttl_ms: How long a reading is reused by later getter calls before the
+                IMU is read again, in milliseconds. 0 disables the cache.
 
         Raises:
             HardwareInitializationError: If the IMU fails to initialize.
@@ -55,6 +105,15 @@ class LSM6DSOXManager(IMUProto, TemperatureSensorProto):
         except Exception as e:
             raise HardwareInitializationError("Failed to initialize IMU") from e
 
+        # Register address byte followed by the gyro and accelerometer data
+        self._burst_buf: bytearray = bytearray(1 + _GYRO_ACCEL_SIZE)
+        # Latest reading and its monotonic timestamp per kind, shared by all callers
+        # so subsystems polling in the same tick share a single bus read
+        self._ttl_ns: int = int(cache_ttl_ms * 1_000_000)
+        self._cache: Dict[str, Tuple[Optional[Reading], int]] = {}
+        self.invalidate()
+        self._batch: List[Union[Acceleration, AngularVelocity]] = []
+
     def get_angular_velocity(self) -> AngularVelocity:
         """Gets the angular velocity from the IMU.
 
@@ -64,15 +123,21 @@ class LSM6DSOXManager(IMUProto, TemperatureSensorProto):
         Raises:
             SensorReadingUnknownError: If an unknown error occurs while reading the angular velocity.
         """
+        now = time.monotonic_ns()
+        cached = self._cached("gyro", now, self._ttl_ns)
+        if cached is not None:
+            return cached
+
         try:
-            return AngularVelocity(
-                self._imu.gyro[0],
-                self._imu.gyro[1],
-                self._imu.gyro[2],
-            )
+            # Each property access is a fresh I2C read, so read the gyro once
+            gyro = self._imu.gyro
+            reading = AngularVelocity(gyro[0], gyro[1], gyro[2])
         except Exception as e:
             raise SensorReadingUnknownError("Failed to read angular velocity") from e
 
+        self._cache["gyro"] = (reading, now)
+        return reading
+
     def get_acceleration(self) -> Acceleration:
         """Gets the acceleration data from the IMU.
 
@@ -82,15 +147,207 @@ class LSM6DSOXManager(IMUProto, TemperatureSensorProto):
         Raises:
             SensorReadingUnknownError: If an unknown error occurs while reading the acceleration data.
         """
+        now = time.monotonic_ns()
+        cached = self._cached("accel", now, self._ttl_ns)
+        if cached is not None:
+            return cached
+
         try:
-            return Acceleration(
-                self._imu.acceleration[0],
-                self._imu.acceleration[1],
-                self._imu.acceleration[2],
-            )
+            # Each property access is a fresh I2C read, so read the accelerometer once
+            acceleration = self._imu.acceleration
+            reading = Acceleration(acceleration[0], acceleration[1], acceleration[2])
         except Exception as e:
             raise SensorReadingUnknownError("Failed to read acceleration") from e
 
+        self._cache["accel"] = (reading, now)
+        return reading
+
+    def get_imu_reading(
+        self, max_age_ms: int = 0
+    ) -> Tuple[Acceleration, AngularVelocity]:
+        """Gets the acceleration and angular velocity from a single I2C burst read.
+
+        Args:
+            max_age_ms: Return the cached readings instead of reading the IMU again if
+                they are less than this many milliseconds old. 0 always reads the IMU.
+
+        Returns:
+            A tuple of the Acceleration in m/s² and the AngularVelocity in radians per second.
+
+        Raises:
+            SensorReadingUnknownError: If an unknown error occurs while reading the IMU.
+        """
+        now = time.monotonic_ns()
+        max_age_ns = max_age_ms * 1_000_000
+        acceleration = self._cached("accel", now, max_age_ns)
+        angular_velocity = self._cached("gyro", now, max_age_ns)
+        if acceleration is not None and angular_velocity is not None:
+            return acceleration, angular_velocity
+
+        try:
+            buf = self._burst_buf
+            self._read_registers(_OUTX_L_G, buf)
+
+            gx, gy, gz, ax, ay, az = struct.unpack_from(_GYRO_ACCEL_FORMAT, buf, 1)
+
+            # Scale with the driver's cached ranges, as its own properties do
+            imu = self._imu
+            acceleration = Acceleration(
+                imu._scale_xl_data(ax),
+                imu._scale_xl_data(ay),
+                imu._scale_xl_data(az),
+            )
+            angular_velocity = AngularVelocity(
+                math.radians(imu._scale_gyro_data(gx)),
+                math.radians(imu._scale_gyro_data(gy)),
+                math.radians(imu._scale_gyro_data(gz)),
+            )
+        except Exception as e:
+            raise SensorReadingUnknownError("Failed to read IMU") from e
+
+        self._cache["accel"] = (acceleration, now)
+        self._cache["gyro"] = (angular_velocity, now)
+        return acceleration, angular_velocity
+
+    def invalidate(self) -> None:
+        """Discards all cached readings so the next getter calls read the IMU."""
+        self._cache["accel"] = (None, 0)
+        self._cache["gyro"] = (None, 0)
+        self._cache["temp"] = (None, 0)
+
+    def _cached(self, kind: str, now: int, max_age_ns: int) -> Optional[Reading]:
+        """Gets a cached reading if it is recent enough.
+
+        Args:
+            kind: The kind of reading, one of "accel", "gyro" or "temp".
+            now: The current time from time.monotonic_ns().
+            max_age_ns: The maximum age of the reading in nanoseconds.
+
+        Returns:
+            The cached reading, or None if there is none or it is too old.
+        """
+        reading, timestamp = self._cache[kind]
+        if reading is not None and now - timestamp < max_age_ns:
+            return reading
+        return None
+
+    def configure_fifo(self, odr: float, watermark: int) -> None:
+        """Batches gyro and accelerometer samples in the IMU's hardware FIFO.
+
+        Samples then accumulate at the IMU's own rate and are read in bulk with
+        drain_fifo() instead of one I2C transaction per sample.
+
+        Args:
+            odr: Batch data rate in Hz for both sensors, one of 12.5, 26, 52, 104,
+                208, 417, 833, 1667, 3333 or 6667. 0 disables the FIFO.
+            watermark: FIFO watermark in entries, 1 to 511.
+
+        Raises:
+            ValueError: If the batch data rate or watermark is not supported.
+            HardwareInitializationError: If the FIFO fails to configure.
+        """
+        if odr == 0:
+            bdr = 0
+            mode = _FIFO_MODE_BYPASS
+        elif odr in _FIFO_BDR:
+            bdr = _FIFO_BDR[odr]
+            mode = _FIFO_MODE_CONTINUOUS
+        else:
+            raise ValueError(f"Unsupported FIFO batch data rate: {odr}")
+
+        if not 1 <= watermark <= _FIFO_MAX_ENTRIES:
+            raise ValueError(f"Unsupported FIFO watermark: {watermark}")
+
+        try:
+            self._write_register(_FIFO_CTRL1, watermark & 0xFF)
+            self._write_register(_FIFO_CTRL2, watermark >> 8)
+            self._write_register(_FIFO_CTRL3, (bdr << 4) | bdr)
+            self._write_register(_FIFO_CTRL4, mode)
+        except Exception as e:
+            raise HardwareInitializationError("Failed to configure IMU FIFO") from e
+
+    def drain_fifo(
+        self, max_entries: int = _FIFO_MAX_ENTRIES
+    ) -> List[Union[Acceleration, AngularVelocity]]:
+        """Reads all unread samples from the IMU's FIFO in one I2C burst.
+
+        Args:
+            max_entries: Maximum number of FIFO entries to read.
+
+        Returns:
+            The samples in the order they were batched, oldest first.
+
+        Raises:
+            SensorReadingUnknownError: If an unknown error occurs while reading the FIFO.
+        """
+        try:
+            status = bytearray(3)
+            self._read_registers(_FIFO_STATUS1, status)
+            count = min(status[1] | ((status[2] & 0x03) << 8), max_entries)
+
+            if count == 0:
+                self._batch = []
+                return self._batch
+
+            buf = bytearray(1 + count * _FIFO_ENTRY_SIZE)
+            self._read_registers(_FIFO_DATA_OUT_TAG, buf)
+        except Exception as e:
+            raise SensorReadingUnknownError("Failed to read IMU FIFO") from e
+
+        imu = self._imu
+        batch: List[Union[Acceleration, AngularVelocity]] = []
+        for offset in range(1, len(buf), _FIFO_ENTRY_SIZE):
+            tag = buf[offset] >> 3
+            x, y, z = struct.unpack_from("<hhh", buf, offset + 1)
+            if tag == _FIFO_TAG_GYRO:
+                batch.append(
+                    AngularVelocity(
+                        math.radians(imu._scale_gyro_data(x)),
+                        math.radians(imu._scale_gyro_data(y)),
+                        math.radians(imu._scale_gyro_data(z)),
+                    )
+                )
+            elif tag == _FIFO_TAG_ACCEL:
+                batch.append(
+                    Acceleration(
+                        imu._scale_xl_data(x),
+                        imu._scale_xl_data(y),
+                        imu._scale_xl_data(z),
+                    )
+                )
+
+        self._batch = batch
+        return batch
+
+    def get_latest_batch(self) -> List[Union[Acceleration, AngularVelocity]]:
+        """Gets the samples read by the last drain_fifo() call.
+
+        Returns:
+            The samples in the order they were batched, oldest first.
+        """
+        return self._batch
+
+    def _read_registers(self, register: int, buf: bytearray) -> None:
+        """Burst reads consecutive registers into buf[1:].
+
+        Args:
+            register: The first register to read.
+            buf: Buffer whose first byte is used for the register address.
+        """
+        buf[0] = register
+        with self._imu.i2c_device as i2c:
+            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
+
+    def _write_register(self, register: int, value: int) -> None:
+        """Writes a single register.
+
+        Args:
+            register: The register to write.
+            value: The byte value to write.
+        """
+        with self._imu.i2c_device as i2c:
+            i2c.write(bytes((register, value)))
+
     def get_temperature(self) -> Temperature:
         """Gets the temperature reading from the IMU.
 
@@ -100,7 +357,15 @@ class LSM6DSOXManager(IMUProto, TemperatureSensorProto):
         Raises:
             SensorReadingUnknownError: If an unknown error occurs while reading the temperature.
         """
+        now = time.monotonic_ns()
+        cached = self._cached("temp", now, self._ttl_ns)
+        if cached is not None:
+            return cached
+
         try:
-            return Temperature(self._imu.temperature)
+            reading = Temperature(self._imu.temperature)
         except Exception as e:
             raise SensorReadingUnknownError("Failed to read temperature") from e
+
+        self._cache["temp"] = (reading, now)
+        return reading
@@ -62,6 +62,8 @@ class VEML7700Manager(LightSensorProto):
         """
         self._log: Logger = logger
         self._i2c: I2C | TCA9548A_Channel = i2c
+        self._light_reading: Light = Light(0.0)
+        self._lux_reading: Lux = Lux(0.0)
 
         try:
             self._log.debug("Initializing light sensor")
@@ -76,13 +78,15 @@ class VEML7700Manager(LightSensorProto):
         """Gets the light reading of the sensor with default gain and integration time.
 
         Returns:
-            A Light object containing a non-unit-specific light level reading.
+            A Light object containing a non-unit-specific light level reading. The
+            same object is updated in place by every call.
 
         Raises:
             SensorReadingUnknownError: If an unknown error occurs while reading the sensor.
         """
         try:
-            return Light(self._light_sensor.light)
+            self._light_reading._set(self._light_sensor.light)
+            return self._light_reading
         except Exception as e:
             raise SensorReadingUnknownError("Failed to get light reading") from e
 
@@ -90,7 +94,8 @@ class VEML7700Manager(LightSensorProto):
         """Gets the light reading of the sensor with default gain and integration time.
 
         Returns:
-            A Lux object containing the light level in SI lux.
+            A Lux object containing the light level in SI lux. The same object is
+            shared with the other lux getter and updated in place by every call.
 
         Raises:
             SensorReadingValueError: If the reading returns an invalid value.
@@ -104,7 +109,8 @@ class VEML7700Manager(LightSensorProto):
         if self._is_invalid_lux(lux):
             raise SensorReadingValueError("Lux reading is invalid or zero")
 
-        return Lux(lux)
+        self._lux_reading._set(lux)
+        return self._lux_reading
 
     def get_auto_lux(self) -> Lux:
         """Gets the auto lux reading of the sensor. This runs the sensor in auto mode
@@ -112,7 +118,8 @@ class VEML7700Manager(LightSensorProto):
         combinations to find the best match.
 
         Returns:
-            A Lux object containing the light level in SI lux.
+            A Lux object containing the light level in SI lux. The same object is
+            shared with the other lux getter and updated in place by every call.
 
         Raises:
             SensorReadingValueError: If the reading returns an invalid value.
@@ -126,7 +133,8 @@ class VEML7700Manager(LightSensorProto):
         if self._is_invalid_lux(lux):
             raise SensorReadingValueError("Lux reading is invalid or zero")
 
-        return Lux(lux)
+        self._lux_reading._set(lux)
+        return self._lux_reading
 
     @staticmethod
     def _is_invalid_lux(lux: float | None) -> bool:
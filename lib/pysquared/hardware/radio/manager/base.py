@@ -69,6 +69,7 @@ class BaseRadioManager(RadioProto):
             True if the data was sent successfully, False otherwise.
         """
         try:
+            # Read the license on every send so config updates take effect at once
             if self._radio_config.license == "":
                 self._log.warning("Radio send attempt failed: Not licensed.")
                 return False
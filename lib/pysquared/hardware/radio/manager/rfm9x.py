@@ -31,7 +31,7 @@ from .base import BaseRadioManager
 
 # Type hinting only
 try:
-    from typing import Optional, Type
+    from typing import Callable, Dict, Optional, Tuple, Type
 except ImportError:
     pass
 
@@ -40,6 +40,8 @@ class RFM9xManager(BaseRadioManager, TemperatureSensorProto):
     """Manages RFM9x radios, implementing the RadioProto interface."""
 
     _radio: RFM9xFSK | RFM9x
+    _modulation: Type[RadioModulation]
+    _config_setters: Dict[str, Callable[[object], None]]
 
     def __init__(
         self,
@@ -95,6 +97,30 @@ class RFM9xManager(BaseRadioManager, TemperatureSensorProto):
             )
 
         self._radio.radiohead = False
+        # The radio type only changes here, so resolve its modulation and the config
+        # setters that apply to it once
+        radio = self._radio
+        if isinstance(radio, RFM9xFSK):
+            self._modulation = FSK
+            self._config_setters = {
+                "broadcast_address": lambda value: setattr(
+                    radio, "fsk_broadcast_address", value
+                ),
+                "node_address": lambda value: setattr(radio, "fsk_node_address", value),
+                "modulation_type": lambda value: setattr(
+                    radio, "modulation_type", value
+                ),
+            }
+        else:
+            self._modulation = LoRa
+            self._config_setters = {
+                "ack_delay": lambda value: setattr(radio, "ack_delay", value),
+                "cyclic_redundancy_check": lambda value: setattr(
+                    radio, "enable_crc", value
+                ),
+                "spreading_factor": self._set_spreading_factor,
+                "transmit_power": lambda value: setattr(radio, "tx_power", value),
+            }
 
     def _send_internal(self, data: bytes) -> bool:
         """Sends data using the RFM9x radio.
@@ -119,29 +145,22 @@ class RFM9xManager(BaseRadioManager, TemperatureSensorProto):
         """
         self._radio_config.validate(key, value)
 
-        # Handle FSK-specific parameters
-        if isinstance(self._radio, RFM9xFSK):
-            if key == "broadcast_address":
-                self._radio.fsk_broadcast_address = value
-            elif key == "node_address":
-                self._radio.fsk_node_address = value
-            elif key == "modulation_type":
-                self._radio.modulation_type = value
-
-        # Handle LoRa-specific parameters
-        elif isinstance(self._radio, RFM9x):
-            if key == "ack_delay":
-                self._radio.ack_delay = value
-            elif key == "cyclic_redundancy_check":
-                self._radio.enable_crc = value
-            elif key == "spreading_factor":
-                self._radio.spreading_factor = value
-                if value > 9:
-                    self._radio.preamble_length = value
-                else:
-                    self._radio.preamble_length = 8  # Default preamble length
-            elif key == "transmit_power":
-                self._radio.tx_power = value
+        # Only FSK or LoRa parameters apply, depending on the current radio
+        setter = self._config_setters.get(key)
+        if setter is not None:
+            setter(value)
+
+    def _set_spreading_factor(self, value: int) -> None:
+        """Sets the LoRa spreading factor and the matching preamble length.
+
+        Args:
+            value: The new spreading factor.
+        """
+        self._radio.spreading_factor = value
+        if value > 9:
+            self._radio.preamble_length = value
+        else:
+            self._radio.preamble_length = 8  # Default preamble length
 
     def get_modulation(self) -> Type[RadioModulation]:
         """Gets the modulation mode from the initialized RFM9x radio.
@@ -149,7 +168,7 @@ class RFM9xManager(BaseRadioManager, TemperatureSensorProto):
         Returns:
             The current modulation mode of the hardware.
         """
-        return FSK if self._radio.__class__.__name__ == "RFM9xFSK" else LoRa
+        return self._modulation
 
     def get_temperature(self) -> Temperature:
         """Gets the temperature reading from the radio sensor.
@@ -160,16 +179,7 @@ class RFM9xManager(BaseRadioManager, TemperatureSensorProto):
             SensorReadingUnknownError: If an unknown error occurs while reading the temperature.
         """
         try:
-            raw_temp = self._radio.read_u8(0x5B)
-            temp = raw_temp & 0x7F  # Mask out sign bit
-            if (raw_temp & 0x80) == 0x80:  # Check sign bit (if 1, it's negative)
-                # Perform two's complement for negative numbers
-                # Invert bits, add 1, mask to 8 bits
-                temp = -((~raw_temp + 1) & 0xFF)
-
-            # This prescaler seems specific and might need verification/context.
-            prescaler = 143.0  # Use float for calculation
-            result = float(temp) + prescaler
+            result = self._read_temperature()
             self._log.debug("Radio temperature read", temp=result)
             return Temperature(result)
         except Exception as e:
@@ -177,6 +187,42 @@ class RFM9xManager(BaseRadioManager, TemperatureSensorProto):
                 "Failed to read temperature from radio"
             ) from e
 
+    def get_telemetry(self) -> Tuple[Temperature, int]:
+        """Gets the radio temperature and the RSSI of the last received packet together.
+
+        Only the temperature needs a register read; the driver records the RSSI when a
+        packet is received, so the snapshot costs a single SPI transaction.
+
+        Returns:
+            A tuple of a Temperature object in degrees Celsius and the RSSI.
+
+        Raises:
+            SensorReadingUnknownError: If an unknown error occurs while reading the temperature.
+        """
+        try:
+            result = self._read_temperature()
+        except Exception as e:
+            raise SensorReadingUnknownError(
+                "Failed to read temperature from radio"
+            ) from e
+
+        self._log.debug("Radio telemetry read", temp=result)
+        return Temperature(result), self.get_rssi()
+
+    def _read_temperature(self) -> float:
+        """Reads and converts the radio's temperature register.
+
+        Returns:
+            The temperature in degrees Celsius.
+        """
+        raw_temp = self._radio.read_u8(0x5B)
+        # The register holds a signed 8-bit two's complement value
+        temp = raw_temp - 256 if raw_temp & 0x80 else raw_temp
+
+        # This prescaler seems specific and might need verification/context.
+        prescaler = 143.0  # Use float for calculation
+        return float(temp) + prescaler
+
     @staticmethod
     def _create_fsk_radio(
         spi: SPI,
@@ -247,14 +293,15 @@ class RFM9xManager(BaseRadioManager, TemperatureSensorProto):
 
         return radio
 
-    def receive(self, timeout: Optional[int] = None) -> bytes | None:
+    def receive(self, timeout: Optional[int] = None) -> bytes | bytearray | None:
         """Receives data from the radio.
 
         Args:
             timeout: Optional receive timeout in seconds. If None, use the default timeout.
 
         Returns:
-            The received data as bytes, or None if no data was received.
+            The received data, or None if no data was received. The driver's freshly
+            allocated bytearray is returned as is rather than copied.
         """
         _timeout = timeout if timeout is not None else self._receive_timeout
         self._log.debug(f"Attempting to receive data with timeout: {_timeout}s")
@@ -268,7 +315,7 @@ class RFM9xManager(BaseRadioManager, TemperatureSensorProto):
                 self._log.debug("No message received")
                 return None
 
-            return bytes(msg)
+            return msg
         except Exception as e:
             self._log.error("Error receiving data", e)
             return None
@@ -98,7 +98,8 @@ class SX126xManager(BaseRadioManager):
         Returns:
             True if the data was sent successfully, False otherwise.
         """
-        _, err = self._radio.send(data)
+        # The driver only accepts bytes or bytearray, not views of the transmit buffer
+        _, err = self._radio.send(bytes(data))
         if err != ERR_NONE:
             self._log.warning("SX126x radio send failed", error_code=err)
             return False
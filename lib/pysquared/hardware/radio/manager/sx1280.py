@@ -100,7 +100,8 @@ class SX1280Manager(BaseRadioManager):
         Returns:
             True if the data was sent successfully, False otherwise.
         """
-        return bool(self._radio.send(data))
+        # The driver isn't known to accept any buffer, so hand it bytes
+        return bool(self._radio.send(bytes(data)))
 
     def get_modulation(self) -> Type[RadioModulation]:
         """Gets the modulation mode from the initialized SX1280 radio.
@@ -15,6 +15,7 @@ received_data = packet_manager.listen()
 """
 
 import math
+import struct
 import time
 
 from ....logger import Logger
@@ -22,10 +23,14 @@ from ....nvm.counter import Counter
 from ....protos.radio import RadioProto
 
 try:
-    from typing import Optional
+    from typing import Iterator, Optional
 except ImportError:
     pass
 
+# 1 byte for packet identifier, 2 bytes for sequence number, 2 for total packets, 1 for rssi
+_HEADER_FORMAT = ">BHHB"
+_HEADER_SIZE = 6
+
 
 class PacketManager:
     """Manages the sending and receiving of data packets over a radio."""
@@ -50,16 +55,24 @@ class PacketManager:
         self._radio: RadioProto = radio
         self._send_delay: float = send_delay
         self._license: str = license
-        # 1 byte for packet identifier, 2 bytes for sequence number, 2 for total packets, 1 for rssi
-        self._header_size: int = 6
-        self._payload_size: int = radio.get_max_packet_size() - self._header_size
+        # The radio's max packet length may be read from the chip, so read it once
+        max_packet_size: int = radio.get_max_packet_size()
+        self._payload_size: int = max_packet_size - _HEADER_SIZE
         self._message_counter: Counter = message_counter
+        # Every outgoing packet is packed in place into this buffer
+        self._tx_buffer: bytearray = bytearray(max_packet_size)
+        self._tx_view: memoryview = memoryview(self._tx_buffer)
+        # Size of the last packet packed into the transmit buffer, 0 if none yet or
+        # if the last send failed
+        self._last_packet_size: int = 0
+        # Number of packets the last message was split into
+        self._last_total_packets: int = 0
 
     def send(self, data: bytes) -> bool:
         """Sends data over the radio.
 
         Args:
-            data: The data to send.
+            data: The data to send. Any bytes-like object, such as a memoryview.
 
         Returns:
             True if the data was sent successfully, False otherwise.
@@ -68,24 +81,38 @@ class PacketManager:
             self._logger.warning("License is required to send data")
             return False
 
-        packets: list[bytes] = self._pack_data(data)
-        total_packets: int = len(packets)
+        total_packets: int = math.ceil(len(data) / self._payload_size)
         self._logger.debug("Sending packets...", num_packets=total_packets)
 
-        for packet in packets:
-            self._radio.send(packet)
+        # Each packet is a view into the transmit buffer, handed to the radio without
+        # copying. The driver writes it to its FIFO before the next packet is packed.
+        last_sequence_number: int = total_packets - 1
+        sequence_number: int = 0
+        for packet in self._iter_packets(data):
+            if not self._radio.send(packet):
+                self._logger.warning(
+                    "Failed to send packet",
+                    sequence_number=sequence_number,
+                    num_packets=total_packets,
+                )
+                self._last_packet_size = 0
+                return False
 
-            # Only add send delay if there are multiple packets
-            if len(packets) > 1:
+            # Only delay between packets, not after the last one
+            if sequence_number < last_sequence_number:
                 time.sleep(self._send_delay)
+            sequence_number += 1
 
         self._logger.debug(
             "Successfully sent all the packets!", num_packets=total_packets
         )
         return True
 
-    def _pack_data(self, data: bytes) -> list[bytes]:
-        """Packs input data into a list of packets ready for transmission.
+    def _iter_packets(self, data: bytes) -> Iterator[memoryview]:
+        """Packs input data into packets ready for transmission.
+
+        Packets are packed one at a time into the shared transmit buffer, so each
+        yielded packet is only valid until the next one is requested.
 
         Each packet includes:
         - 1 byte: packet identifier
@@ -97,8 +124,8 @@ class PacketManager:
         Args:
             data: The data to pack.
 
-        Returns:
-            A list of packets.
+        Yields:
+            A view of each packet in the transmit buffer.
         """
         # Calculate number of packets needed
         total_packets: int = math.ceil(len(data) / self._payload_size)
@@ -109,112 +136,180 @@ class PacketManager:
         )
 
         packet_identifier: int = self._get_packet_identifier()
+        self._last_total_packets = total_packets
 
-        packets: list[bytes] = []
+        # The RSSI is read once per message rather than once per packet
+        rssi: int = abs(self._radio.get_rssi())
+
+        buf: bytearray = self._tx_buffer
+        payload_size: int = self._payload_size
+        data_view: memoryview = memoryview(data)
         for sequence_number in range(total_packets):
             # Create header
-            header: bytes = (
-                packet_identifier.to_bytes(1, "big")
-                + sequence_number.to_bytes(2, "big")
-                + total_packets.to_bytes(2, "big")
-                + abs(self._radio.get_rssi()).to_bytes(1, "big")
+            struct.pack_into(
+                _HEADER_FORMAT,
+                buf,
+                0,
+                packet_identifier,
+                sequence_number,
+                total_packets,
+                rssi,
             )
 
-            # Get payload slice for this packet
-            start: int = sequence_number * self._payload_size
-            end: int = start + self._payload_size
-            payload: bytes = data[start:end]
+            # Copy the payload slice for this packet in after the header
+            start: int = sequence_number * payload_size
+            payload: memoryview = data_view[start : start + payload_size]
+            end: int = _HEADER_SIZE + len(payload)
+            buf[_HEADER_SIZE:end] = payload
+            self._last_packet_size = end
+
+            yield self._tx_view[:end]
+
+    def retransmit_last(self) -> bool:
+        """Resends the most recently sent packet under a new packet identifier.
 
-            # Combine header and payload
-            packet: bytes = header + payload
-            packets.append(packet)
+        The packet is still in the transmit buffer, so only its identifier byte is
+        rewritten instead of packing the data again. Only single-packet messages, such
+        as acknowledgements, can be retransmitted: a lone fragment of a longer message
+        under a new identifier could never be reassembled by the receiver.
 
-        return packets
+        Returns:
+            True if the packet was resent, False otherwise.
+        """
+        if self._license == "":
+            self._logger.warning("License is required to send data")
+            return False
+
+        if self._last_packet_size == 0:
+            self._logger.warning("No packet to retransmit")
+            return False
+
+        if self._last_total_packets > 1:
+            self._logger.warning(
+                "Cannot retransmit part of a multi-packet message",
+                num_packets=self._last_total_packets,
+            )
+            return False
+
+        struct.pack_into(">B", self._tx_buffer, 0, self._get_packet_identifier())
+        if not self._radio.send(self._tx_view[: self._last_packet_size]):
+            self._logger.warning("Failed to retransmit last packet")
+            return False
 
-    def listen(self, timeout: Optional[int] = None) -> bytes | None:
+        self._logger.debug("Retransmitted last packet")
+        return True
+
+    def listen(self, timeout: Optional[int] = None) -> bytearray | None:
         """Listens for data from the radio.
 
         Args:
             timeout: Optional receive timeout in seconds. If None, use the default timeout.
 
         Returns:
-            The received data as bytes, or None if no data was received.
+            The received data, or None if no data was received.
         """
         _timeout = timeout if timeout is not None else 10
 
         self._logger.debug("Listening for data...", timeout=_timeout)
 
-        start_time = time.time()
-        received_packets = []
+        # Monotonic integer nanoseconds are unaffected by RTC adjustments
+        start_ns = time.monotonic_ns()
+        deadline_ns = start_ns + int(_timeout * 1_000_000_000)
+
+        # Packets are placed directly by sequence number once the first one tells us
+        # how many to expect
+        first_packet_identifier: Optional[int] = None
+        slots: list[Optional[bytes]] = []
+        received_count: int = 0
 
         # Keep receiving until timeout or we have all packets
         while True:
             # Stop listening if timeout is reached
-            if time.time() - start_time > _timeout:
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
                 self._logger.debug(
                     "Listen timeout reached",
-                    elapsed=time.time() - start_time,
+                    elapsed=(time.monotonic_ns() - start_ns) / 1_000_000_000,
                 )
                 return
 
-            # Try to receive a packet
-            packet = self._radio.receive(_timeout)
+            # Try to receive a packet, waiting no longer than the remaining budget
+            packet = self._radio.receive(max(0.01, remaining_ns / 1_000_000_000))
 
             # If no packet received, continue waiting
             if packet is None:
                 continue
 
-            packet_identifier, _, total_packets, _ = self._get_header(packet)
+            # Runt or noise frames can't be unpacked, and _unpack_data expects every
+            # stored packet to carry a full header
+            if len(packet) < _HEADER_SIZE:
+                self._logger.debug(
+                    "Dropping packet shorter than header", packet_length=len(packet)
+                )
+                continue
+
+            header = self._get_header(packet)
+            packet_identifier, sequence_number, total_packets, _ = header
 
             # Log received packets
             self._logger.debug(
                 "Received packet",
                 packet_length=len(packet),
-                header=self._get_header(packet),
-                payload=self._get_payload(packet),
+                header=header,
+                payload_len=len(packet) - _HEADER_SIZE,
             )
 
-            if received_packets:
-                (
-                    first_packet_identifier,
-                    _,
-                    _,
-                    _,
-                ) = self._get_header(received_packets[0])
-                if packet_identifier != first_packet_identifier:
-                    continue
+            if first_packet_identifier is None:
+                first_packet_identifier = packet_identifier
+                slots = [None] * total_packets
+            elif packet_identifier != first_packet_identifier:
+                continue
+
+            if sequence_number >= len(slots):
+                continue
 
-            received_packets.append(packet)
+            if slots[sequence_number] is None:
+                received_count += 1
+            slots[sequence_number] = packet
 
             # Check if we have all packets
-            if total_packets == len(received_packets):
+            if received_count == len(slots):
                 self._logger.debug(
-                    "Received all expected packets", received=total_packets
+                    "Received all expected packets", received=received_count
                 )
                 break
 
         # Attempt to unpack the data
-        return self._unpack_data(received_packets)
+        return self._unpack_data(slots)
 
     def send_acknowledgement(self) -> None:
         """Sends an acknowledgment to the radio."""
         self.send(b"ACK")
         self._logger.debug("Sent acknowledgment packet")
 
-    def _unpack_data(self, packets: list[bytes]) -> bytes:
+    def _unpack_data(self, packets: list[bytes]) -> bytearray:
         """Unpacks a list of packets and reassembles the original data.
 
         Args:
-            packets: A list of packets.
+            packets: A list of packets, ordered by sequence number, each at least
+                _HEADER_SIZE bytes long.
 
         Returns:
-            The reassembled data.
+            The reassembled data, in the buffer it was copied into.
         """
-        sorted_packets: list = sorted(
-            packets, key=lambda p: int.from_bytes(p[1:3], "big")
-        )
+        # Copy each payload straight into one buffer rather than slicing every packet
+        size: int = 0
+        for packet in packets:
+            size += len(packet) - _HEADER_SIZE
 
-        return b"".join(self._get_payload(packet) for packet in sorted_packets)
+        data: bytearray = bytearray(size)
+        offset: int = 0
+        for packet in packets:
+            end: int = offset + len(packet) - _HEADER_SIZE
+            data[offset:end] = memoryview(packet)[_HEADER_SIZE:]
+            offset = end
+
+        return data
 
     def _get_header(self, packet: bytes) -> tuple[int, int, int, int]:
         """Returns the sequence number, total packets, and RSSI stored in the header.
@@ -225,23 +320,10 @@ class PacketManager:
         Returns:
             A tuple containing the sequence number, total packets, and RSSI.
         """
-        return (
-            int.from_bytes(packet[0:1], "big"),  # packet identifier
-            int.from_bytes(packet[1:3], "big"),  # sequence number
-            int.from_bytes(packet[3:5], "big"),  # total packets
-            -int.from_bytes(packet[5:6], "big"),  # RSSI
+        packet_identifier, sequence_number, total_packets, rssi = struct.unpack_from(
+            _HEADER_FORMAT, packet
         )
-
-    def _get_payload(self, packet: bytes) -> bytes:
-        """Returns the payload of the packet.
-
-        Args:
-            packet: The packet to extract the payload from.
-
-        Returns:
-            The payload of the packet.
-        """
-        return packet[self._header_size :]
+        return packet_identifier, sequence_number, total_packets, -rssi
 
     def _get_packet_identifier(self) -> int:
         """Increments message_counter and returns the current identifier for a packet"""
@@ -17,9 +17,11 @@ class SDCardManager:
         self,
         spi_bus: SPI,
         chip_select: Pin,
-        baudrate: int = 400000,
+        baudrate: int = 12_000_000,
         mount_path: str = "/sd",
     ) -> None:
+        # sdcardio initializes the card at a slow clock and then switches to the
+        # requested baudrate, so a fast default is safe for file transfers
         try:
             sd = sdcardio.SDCard(spi_bus, chip_select, baudrate)
             vfs = storage.VfsFat(sd)  # type: ignore # Issue: https://github.com/adafruit/Adafruit_CircuitPython_Typing/issues/51
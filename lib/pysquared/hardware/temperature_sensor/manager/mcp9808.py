@@ -21,6 +21,9 @@ from ....sensor_reading.error import SensorReadingUnknownError
 from ....sensor_reading.temperature import Temperature
 from ...exception import HardwareInitializationError
 
+# Pointer to the ambient temperature register
+_AMBIENT_TEMP_REGISTER = b"\x05"
+
 
 class MCP9808Manager(TemperatureSensorProto):
     """Manages the MCP9808 temperature sensor."""
@@ -59,18 +62,67 @@ class MCP9808Manager(TemperatureSensorProto):
                 "Failed to initialize MCP9808 temperature sensor"
             ) from e
 
+        # Temperature reads bypass the driver property and reuse one buffer
+        self._i2c_device = self._mcp9808.i2c_device
+        self._raw_buf: bytearray = bytearray(2)
+        self._reading: Temperature = Temperature(0.0)
+
+    def _read_celsius(self) -> float:
+        """Reads the ambient temperature register and converts it to Celsius.
+
+        Returns:
+            The temperature in degrees Celsius.
+        """
+        buf = self._raw_buf
+        with self._i2c_device as i2c:
+            i2c.write_then_readinto(_AMBIENT_TEMP_REGISTER, buf)
+
+        # 13-bit two's complement value in 1/16 degree steps, the upper 3 bits are alert flags
+        raw = (buf[0] << 8) | buf[1]
+        return ((raw & 0x0FFF) - (raw & 0x1000)) / 16.0
+
     def get_temperature(self) -> Temperature:
         """Gets the temperature reading from the MCP9808.
 
         Returns:
-            A Temperature object containing the temperature in degrees Celsius.
+            A Temperature object containing the temperature in degrees Celsius. The
+            same object is updated in place by every call.
 
         Raises:
-            SensorReadingUnknownError: If an unknown error occurs while reading the temperature.
+            SensorReadingUnknownError: If the I2C transaction fails while reading the temperature.
         """
         try:
-            return Temperature(self._mcp9808.temperature)
-        except Exception as e:
+            self._reading._set(self._read_celsius())
+            return self._reading
+        except OSError as e:
+            raise SensorReadingUnknownError(
+                "Failed to read temperature from MCP9808"
+            ) from e
+
+    def get_temperature_avg(self, num_readings: int = 50) -> Temperature:
+        """Gets the average of several back to back temperature readings.
+
+        Args:
+            num_readings: The number of readings to average.
+
+        Returns:
+            A Temperature object containing the average temperature in degrees Celsius.
+
+        Raises:
+            ValueError: If num_readings is not positive.
+            SensorReadingUnknownError: If the I2C transaction fails while reading the temperature.
+        """
+        if num_readings <= 0:
+            raise ValueError("num_readings must be positive")
+
+        read_celsius = self._read_celsius
+        total = 0.0
+        try:
+            for _ in range(num_readings):
+                total += read_celsius()
+        except OSError as e:
             raise SensorReadingUnknownError(
                 "Failed to read temperature from MCP9808"
             ) from e
+
+        return Temperature(total / num_readings)
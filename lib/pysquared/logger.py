@@ -1,7 +1,8 @@
 """This module provides a Logger class for handling logging messages.
 
 The Logger class supports different severity levels, colorized output, and error
-counting. Logs are formatted as JSON and can be output to the console.
+counting. Logs are formatted as JSON and can be output to the console. The log
+file can optionally be written in a compact binary format instead.
 
 **Usage:**
 ```python
@@ -14,13 +15,27 @@ logger.error("This is an error message.", err=Exception("Something went wrong.")
 
 import json
 import os
+import struct
 import time
 import traceback
-from collections import OrderedDict
 
 from .nvm.counter import Counter
 
 
+# ANSI escape codes used by _color
+_COLOR_CODES = {
+    "red": "1",
+    "green": "2",
+    "orange": "3",
+    "blue": "4",
+    "pink": "5",
+    "teal": "6",
+    "white": "7",
+    "gray": "9",
+}
+_FORMAT_CODES = {"normal": "0", "bold": "1", "ulined": "4"}
+
+
 def _color(msg, color="gray", fmt="normal") -> str:
     """
     Returns a colorized string for terminal output.
@@ -33,32 +48,147 @@ def _color(msg, color="gray", fmt="normal") -> str:
     Returns:
         str: The colorized message.
     """
-    _h = "\033["
-    _e = "\033[0;39;49m"
-
-    _c = {
-        "red": "1",
-        "green": "2",
-        "orange": "3",
-        "blue": "4",
-        "pink": "5",
-        "teal": "6",
-        "white": "7",
-        "gray": "9",
-    }
-
-    _f = {"normal": "0", "bold": "1", "ulined": "4"}
-    return _h + _f[fmt] + ";3" + _c[color] + "m" + msg + _e
-
-
-LogColors = {
-    "NOTSET": "NOTSET",
-    "DEBUG": _color(msg="DEBUG", color="blue"),
-    "INFO": _color(msg="INFO", color="green"),
-    "WARNING": _color(msg="WARNING", color="orange"),
-    "ERROR": _color(msg="ERROR", color="pink"),
-    "CRITICAL": _color(msg="CRITICAL", color="red"),
-}
+    return f"\033[{_FORMAT_CODES[fmt]};3{_COLOR_CODES[color]}m{msg}\033[0;39;49m"
+
+
+# Level value -> level name and the color used for it in colorized output
+_LEVEL_NAMES = ("NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LEVEL_COLORS = (None, "blue", "green", "orange", "pink", "red")
+
+
+def _level_fragment(level: str) -> str:
+    """
+    Returns the part of a JSON log record between the time value and the message value.
+
+    Args:
+        level (str): The level token to embed.
+
+    Returns:
+        str: The JSON fragment.
+    """
+    return '", "level": "' + level + '", "msg": '
+
+
+def _get_level_color(level_value: int) -> str:
+    """
+    Returns the colorized level token for terminal output.
+
+    Args:
+        level_value (int): The severity level as an integer.
+
+    Returns:
+        str: The colorized level name.
+    """
+    name = _LEVEL_NAMES[level_value]
+    color = _LEVEL_COLORS[level_value]
+    return name if color is None else _color(name, color)
+
+
+# Record timestamp layout, filled from the first six fields of a struct_time
+_TIME_FORMAT = "%d-%02d-%02d %02d:%02d:%02d"
+
+# Buffered file output is flushed once this many bytes are pending
+_FLUSH_THRESHOLD = 512
+
+# Level value -> JSON fragment carrying the level name
+_LEVEL_FRAGMENTS = tuple(_level_fragment(name) for name in _LEVEL_NAMES)
+
+# Level value -> colorized JSON fragment, only filled in once colorized output is used
+_colorized_fragments = {}
+
+
+def _get_colorized_fragment(level_value: int) -> str:
+    """
+    Returns the JSON fragment with the colorized level name, built on first use.
+
+    Args:
+        level_value (int): The severity level as an integer.
+
+    Returns:
+        str: The JSON fragment.
+    """
+    fragment = _colorized_fragments.get(level_value)
+    if fragment is None:
+        fragment = _level_fragment(_get_level_color(level_value))
+        _colorized_fragments[level_value] = fragment
+    return fragment
+
+
+# Binary log records: timestamp, level, message length and field count, followed
+# by the message and one tagged field per keyword argument
+_BINARY_HEADER_FORMAT = "<IBHB"
+_BINARY_FIELD_FORMAT = "<BH"
+_TAG_STR = 0
+_TAG_INT = 1
+_TAG_FLOAT = 2
+_TAG_BOOL = 3
+_TAG_NONE = 4
+_TAG_JSON = 5
+
+
+def _pack_binary_field(key: str, value) -> bytes:
+    """
+    Packs a keyword argument as a tagged, length prefixed binary field.
+
+    Args:
+        key (str): The field name.
+        value: The field value.
+
+    Returns:
+        bytes: The key length and key, followed by the type tag, payload length and payload.
+    """
+    value_type = type(value)
+    if value_type is str:
+        tag, payload = _TAG_STR, value.encode()
+    elif value_type is bool:
+        tag, payload = _TAG_BOOL, b"\x01" if value else b"\x00"
+    elif value_type is int and -0x80000000 <= value <= 0x7FFFFFFF:
+        tag, payload = _TAG_INT, struct.pack("<i", value)
+    elif value_type is float:
+        tag, payload = _TAG_FLOAT, struct.pack("<f", value)
+    elif value is None:
+        tag, payload = _TAG_NONE, b""
+    else:
+        try:
+            payload = json.dumps(value).encode()
+        except TypeError:
+            payload = json.dumps(str(value)).encode()
+        tag = _TAG_JSON
+
+    name = key.encode()
+    return (
+        bytes((len(name),))
+        + name
+        + struct.pack(_BINARY_FIELD_FORMAT, tag, len(payload))
+        + payload
+    )
+
+
+def _pack_binary_record(
+    timestamp: int, level_value: int, message: str, fields: dict
+) -> bytes:
+    """
+    Packs a log record into the binary log file format.
+
+    Args:
+        timestamp (int): The record time in seconds.
+        level_value (int): The severity level as an integer.
+        message (str): The log message.
+        fields (dict): Additional key/value pairs to include in the record.
+
+    Returns:
+        bytes: The packed record.
+    """
+    msg = str(message).encode()
+    parts = [
+        struct.pack(
+            _BINARY_HEADER_FORMAT, timestamp, level_value, len(msg), len(fields)
+        ),
+        msg,
+    ]
+    for key, value in fields.items():
+        parts.append(_pack_binary_field(key, value))
+    return b"".join(parts)
 
 
 class LogLevel:
@@ -78,12 +208,16 @@ class Logger:
     """Handles logging messages with different severity levels."""
 
     _log_dir: str | None = None
+    _log_file: str | None = None
+    _log_fh = None
+    _unflushed_bytes: int = 0
 
     def __init__(
         self,
         error_counter: Counter,
         log_level: int = LogLevel.NOTSET,
         colorized: bool = False,
+        binary: bool = False,
     ) -> None:
         """
         Initializes the Logger instance.
@@ -92,82 +226,74 @@ class Logger:
             error_counter: Counter for error occurrences.
             log_level: Initial log level.
             colorized: Whether to colorize output.
+            binary: Whether to write the log file as binary records instead of JSON lines.
         """
         self._error_counter: Counter = error_counter
         self._log_level: int = log_level
         self._colorized: bool = colorized
+        self._binary: bool = binary
+        self._last_second: int = -1
+        self._last_asctime: str = ""
 
-    def _can_print_this_level(self, level_value: int) -> bool:
-        """
-        Checks if the message should be printed based on the log level.
-
-        Args:
-            level_value (int): The severity level of the message.
-
-        Returns:
-            bool: True if the message should be printed, False otherwise.
-        """
-        return level_value >= self._log_level
-
-    def _is_valid_json_type(self, object) -> bool:
-        """Checks if the object is a valid JSON type.
-
-        Args:
-            object: The object to check.
-
-        Returns:
-            True if the object is a valid JSON type, False otherwise.
-        """
-        valid_types = {dict, list, tuple, str, int, float, bool, None}
-
-        return type(object) in valid_types
-
-    def _log(self, level: str, level_value: int, message: str, **kwargs) -> None:
+    def _log(self, level_value: int, message: str, **kwargs) -> None:
         """
         Log a message with a given severity level and any additional key/values.
 
+        The level is checked by the public logging methods before calling, so
+        suppressed messages never reach this method. Exceptions are expected to be
+        formatted by the caller, any other values are logged as JSON or as their
+        string form.
+
         Args:
-            level (str): The severity level as a string.
             level_value (int): The severity level as an integer.
             message (str): The log message.
             **kwargs: Additional key/value pairs to include in the log.
         """
-        now = time.localtime()  # type: ignore # PR: https://github.com/adafruit/circuitpython/pull/10603
-        asctime = f"{now.tm_year}-{now.tm_mon:02d}-{now.tm_mday:02d} {now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"  # type: ignore # PR: https://github.com/adafruit/circuitpython/pull/10603
-
-        # case where someone used debug, info, or warning yet also provides an 'err' kwarg with an Exception
-        if (
-            "err" in kwargs
-            and level not in ("ERROR", "CRITICAL")
-            and isinstance(kwargs["err"], Exception)
-        ):
-            kwargs["err"] = traceback.format_exception(kwargs["err"])
-
-        json_order: OrderedDict[str, str] = OrderedDict(
-            [("time", asctime), ("level", level), ("msg", message)]
-        )
-
-        # detect if there are kwargs with invalid types (would cause TypeError) and converting object to string type, making it loggable
+        # The timestamp only changes once a second, so bursts of messages reuse it
+        second = int(time.time())
+        if second != self._last_second:
+            now = time.localtime(second)  # type: ignore # PR: https://github.com/adafruit/circuitpython/pull/10603
+            self._last_asctime = _TIME_FORMAT % now[:6]
+            self._last_second = second
+        asctime = self._last_asctime
+
+        # Build the JSON record directly, in the same layout json.dumps produces. Only
+        # the values need encoding, the keys are always plain identifiers.
+        dumps = json.dumps
+        parts = [dumps(message)]
+        append = parts.append
         for key, value in kwargs.items():
-            if not self._is_valid_json_type(value):
-                kwargs[key] = str(value)
-
-        json_order.update(kwargs)
-
-        json_output = json.dumps(json_order)
-
-        if self._can_print_this_level(level_value):
-            if self._log_dir is not None:
-                file = self._log_dir + os.sep + "activity.log"
-                with open(file, "a") as f:
-                    f.write(json_output + "\n")
-
-            if self._colorized:
-                json_output = json_output.replace(
-                    f'"level": "{level}"', f'"level": "{LogColors[level]}"'
-                )
-
-            print(json_output)
+            append(', "' + key + '": ')
+            try:
+                append(dumps(value))
+            except TypeError:
+                # Values JSON can't represent are logged as their string form
+                append(dumps(str(value)))
+        append("}")
+
+        head = '{"time": "' + asctime
+        tail = "".join(parts)
+        plain = _LEVEL_FRAGMENTS[level_value]
+
+        log_fh = self._log_fh
+        if log_fh is not None:
+            if self._binary:
+                line = _pack_binary_record(second, level_value, message, kwargs)
+            else:
+                line = head + plain + tail + "\n"
+            log_fh.write(line)
+            unflushed = self._unflushed_bytes + len(line)
+            # Warnings and above are flushed right away so they survive a reset
+            if level_value >= LogLevel.WARNING or unflushed >= _FLUSH_THRESHOLD:
+                log_fh.flush()
+                unflushed = 0
+            self._unflushed_bytes = unflushed
+
+        # Only the console copy is colorized
+        if self._colorized:
+            print(head + _get_colorized_fragment(level_value) + tail)
+        else:
+            print(head + plain + tail)
 
     def debug(self, message: str, **kwargs: object) -> None:
         """
@@ -177,7 +303,8 @@ class Logger:
             message (str): The log message.
             **kwargs: Additional key/value pairs to include in the log.
         """
-        self._log("DEBUG", 1, message, **kwargs)
+        if LogLevel.DEBUG >= self._log_level:
+            self._log(LogLevel.DEBUG, message, **kwargs)
 
     def info(self, message: str, **kwargs: object) -> None:
         """
@@ -187,7 +314,8 @@ class Logger:
             message (str): The log message.
             **kwargs: Additional key/value pairs to include in the log.
         """
-        self._log("INFO", 2, message, **kwargs)
+        if LogLevel.INFO >= self._log_level:
+            self._log(LogLevel.INFO, message, **kwargs)
 
     def warning(self, message: str, **kwargs: object) -> None:
         """
@@ -197,7 +325,8 @@ class Logger:
             message (str): The log message.
             **kwargs: Additional key/value pairs to include in the log.
         """
-        self._log("WARNING", 3, message, **kwargs)
+        if LogLevel.WARNING >= self._log_level:
+            self._log(LogLevel.WARNING, message, **kwargs)
 
     def error(self, message: str, err: Exception, **kwargs: object) -> None:
         """
@@ -208,9 +337,14 @@ class Logger:
             err (Exception): The exception to log.
             **kwargs: Additional key/value pairs to include in the log.
         """
-        kwargs["err"] = traceback.format_exception(err)
         self._error_counter.increment()
-        self._log("ERROR", 4, message, **kwargs)
+        if LogLevel.ERROR >= self._log_level:
+            self._log(
+                LogLevel.ERROR,
+                message,
+                err=traceback.format_exception(err),
+                **kwargs,
+            )
 
     def critical(self, message: str, err: Exception, **kwargs: object) -> None:
         """
@@ -221,9 +355,14 @@ class Logger:
             err (Exception): The exception to log.
             **kwargs: Additional key/value pairs to include in the log.
         """
-        kwargs["err"] = traceback.format_exception(err)
         self._error_counter.increment()
-        self._log("CRITICAL", 5, message, **kwargs)
+        if LogLevel.CRITICAL >= self._log_level:
+            self._log(
+                LogLevel.CRITICAL,
+                message,
+                err=traceback.format_exception(err),
+                **kwargs,
+            )
 
     def get_error_count(self) -> int:
         """
@@ -244,6 +383,10 @@ class Logger:
         Raises:
             ValueError: If the provided path is not a valid directory.
         """
+        # Already logging to this directory, no need to stat it and reopen the file
+        if log_dir == self._log_dir and self._log_fh is not None:
+            return
+
         try:
             # Octal number 0o040000 is the stat mode indicating the file being stat'd is a directory
             directory_mode: int = 0o040000
@@ -255,4 +398,23 @@ class Logger:
         except OSError as e:
             raise ValueError("Invalid logging path.") from e
 
+        self.close()
         self._log_dir = log_dir
+        # CircuitPython paths always use "/" as the separator
+        if self._binary:
+            self._log_file = log_dir + "/activity.bin"
+            self._log_fh = open(self._log_file, "ab")
+        else:
+            self._log_file = log_dir + "/activity.log"
+            self._log_fh = open(self._log_file, "a")
+
+    def close(self) -> None:
+        """
+        Flushes and closes the log file, if one is open.
+        """
+        if self._log_fh is None:
+            return
+
+        self._log_fh.close()
+        self._log_fh = None
+        self._unflushed_bytes = 0
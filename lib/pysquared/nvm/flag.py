@@ -14,6 +14,7 @@ class Flag:
         _bit (int): The bit index within the byte.
         _datastore (microcontroller.nvm.ByteArray): The NVM datastore.
         _bit_mask (int): Bitmask for the flag's bit position.
+        _bit_mask_inv (int): Inverted bitmask used to clear the flag's bit.
     """
 
     def __init__(
@@ -40,6 +41,7 @@ class Flag:
         self._datastore = microcontroller.nvm  # Array of bytes (Non-volatile Memory)
         self._bit_mask = 1 << bit_index  # Creating bitmask with bit position
         # Ex. bit = 3 -> 3 % 8 = 3 -> 1 << 3 = 00001000
+        self._bit_mask_inv = ~self._bit_mask & 0xFF  # Ex. 11110111
 
     def get(self) -> bool:
         """
@@ -57,12 +59,17 @@ class Flag:
         Args:
             value (bool): If True, sets the flag; if False, clears the flag.
         """
+        current = self._datastore[self._index]
         if value:
             # If true, perform OR on specific byte and bitmask to set bit to 1
-            self._datastore[self._index] |= self._bit_mask
+            updated = current | self._bit_mask
         else:
             # If false, perform AND on specific byte and inverted bitmask to set bit to 0
-            self._datastore[self._index] &= ~self._bit_mask
+            updated = current & self._bit_mask_inv
+
+        # Skip the NVM write when the bit already holds the requested value
+        if updated != current:
+            self._datastore[self._index] = updated
 
     def get_name(self) -> str:
         """
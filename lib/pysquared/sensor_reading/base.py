@@ -22,6 +22,15 @@ class Reading(ReadingProto):
         """Get the timestamp of the reading."""
         return self._timestamp
 
+    def _set(self, value) -> None:
+        """Update a scalar reading in place with a new value and timestamp.
+
+        Args:
+            value: The new reading value.
+        """
+        self._value = value
+        self._timestamp = time.time()
+
     @property
     def value(self) -> Tuple[float, float, float] | float:
         """Get the value of the reading.
@@ -6,6 +6,7 @@ import struct
 from i2cdisplaybus import I2CDisplayBus
 import adafruit_displayio_ssd1306
 import binascii
+import collections
 import usb_cdc
 
 from pysquared.hardware.radio.packetizer.packet_manager import PacketManager
@@ -38,6 +39,14 @@ INDICATE_END = 0x03
 # usb_cdc terminator
 USB_TERMINATOR = b"\r\n"
 
+# Image packet layouts: the start and data packets share the indicator/u32/u32 header
+START_FORMAT = "<BII"
+START_SIZE = struct.calcsize(START_FORMAT)
+CHUNK_HEADER_FORMAT = "<BII"
+CHUNK_HEADER_SIZE = struct.calcsize(CHUNK_HEADER_FORMAT)
+END_FORMAT = "<B"
+END_SIZE = struct.calcsize(END_FORMAT)
+
 display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=WIDTH, height=HEIGHT)
 
 # RADIO_FREQ_MHZ = 915.0
@@ -80,9 +89,41 @@ packet_manager = PacketManager(
 
 serial = usb_cdc.data
 
+# Reused for every packet forwarded to the host, with room for the terminator
+TX_BUFFER = bytearray(2048)
+TX_VIEW = memoryview(TX_BUFFER)
+
+# Image payloads are gathered here and run through the file CRC a window at a time
+CRC_WINDOW = bytearray(2048)
+CRC_VIEW = memoryview(CRC_WINDOW)
+
+# Per-chunk messages are queued here and printed once the receive loop is idle
+_LOG = collections.deque((), 64)
+
+
+def _dlog(msg: str) -> None:
+    _LOG.append(msg)
+
+
+# Writes a packet followed by the USB terminator to the host in a single write
+def forward_to_host(packet: bytes) -> None:
+    end = len(packet)
+    if end + len(USB_TERMINATOR) > len(TX_BUFFER):
+        serial.write(packet)
+        serial.write(USB_TERMINATOR)
+        return
+
+    TX_BUFFER[:end] = packet
+    TX_BUFFER[end : end + len(USB_TERMINATOR)] = USB_TERMINATOR
+    serial.write(TX_VIEW[: end + len(USB_TERMINATOR)])
+
 
 def receive_and_verify_image(packet_manager: PacketManager) -> bool:
-    start_packet = struct.unpack("<BII", packet_manager.listen(timeout=1.0))
+    start_raw = packet_manager.listen(timeout=1.0)
+    if start_raw is None or len(start_raw) < START_SIZE:
+        print("did not receive a complete start packet")
+        return False
+    start_packet = struct.unpack_from(START_FORMAT, start_raw)
 
     if start_packet[0] == INDICATE_START:
         total_chunks = start_packet[1]
@@ -92,43 +133,66 @@ def receive_and_verify_image(packet_manager: PacketManager) -> bool:
             f"start_packet was INDICATE_START with {total_chunks} chunks and crc of {file_crc}"
         )
 
-        serial.write(start_packet + USB_TERMINATOR)
+        forward_to_host(start_raw)
 
-        for i in range(total_chunks):
-            print("listening for next chunk")
-            packed_chunk = packet_manager.listen(timeout=30.0)
-            print(f"got chunk with size {len(packed_chunk)}")
-
-            serial.write(packed_chunk + USB_TERMINATOR)
-
-            HEADER_FMT = "<BII"
-            HEADER_SIZE = struct.calcsize(HEADER_FMT)
+        # Bind the per-chunk calls to locals so the loop skips global/attribute lookups
+        crc32 = binascii.crc32
+        listen = packet_manager.listen
+        unpack_from = struct.unpack_from
+        forward = forward_to_host
+        dlog = _dlog
+        window_fill = 0
 
-            indicator, crc32, chunk_index = struct.unpack(
-                HEADER_FMT, packed_chunk[:HEADER_SIZE]
-            )
-
-            chunk = packed_chunk[HEADER_SIZE:]
-            received_total_crc = binascii.crc32(chunk, received_total_crc)
+        for i in range(total_chunks):
+            dlog("listening for next chunk")
+            packed_chunk = listen(timeout=30.0)
+            if packed_chunk is None:
+                print("timed out waiting for chunk")
+                return False
+            dlog(f"got chunk with size {len(packed_chunk)}")
+
+            # CRCs are verified on the host, only make sure the header is all there
+            if len(packed_chunk) < CHUNK_HEADER_SIZE:
+                print("chunk is shorter than its header")
+                return False
+
+            forward(packed_chunk)
+
+            # The per-chunk CRC is checked by the host, the file CRC covers it here
+            indicator, _, chunk_index = unpack_from(CHUNK_HEADER_FORMAT, packed_chunk)
+
+            # Batch payloads so the CRC is called once per window, not once per chunk
+            chunk = memoryview(packed_chunk)[CHUNK_HEADER_SIZE:]
+            if window_fill + len(chunk) > len(CRC_WINDOW):
+                received_total_crc = crc32(CRC_VIEW[:window_fill], received_total_crc)
+                window_fill = 0
+            if len(chunk) > len(CRC_WINDOW):
+                received_total_crc = crc32(chunk, received_total_crc)
+            else:
+                CRC_WINDOW[window_fill : window_fill + len(chunk)] = chunk
+                window_fill += len(chunk)
 
             if indicator != INDICATE_DATA:
-                print(
+                dlog(
                     f"data packet type indicator byte was not data, was instead {indicator}"
                 )
             elif indicator == INDICATE_END:
-                print("data packet type indicator byte is end")
-
-            if binascii.crc32(chunk) != crc32:
-                print("chunk crc does not match")
+                dlog("data packet type indicator byte is end")
 
             if i != chunk_index:
-                print(f"loop index ({i}) is not chunk index ({chunk_index})")
+                dlog(f"loop index ({i}) is not chunk index ({chunk_index})")
+
+        received_total_crc = crc32(CRC_VIEW[:window_fill], received_total_crc)
 
-        end_packet = struct.unpack("<B", packet_manager.listen(timeout=1.0))
+        end_raw = packet_manager.listen(timeout=1.0)
+        if end_raw is None or len(end_raw) < END_SIZE:
+            print("did not receive a complete end packet")
+            return False
+        end_packet = struct.unpack_from(END_FORMAT, end_raw)
         if end_packet[0] != INDICATE_END:
             print("last data packet was not end packet")
         else:
-            serial.write(end_packet + USB_TERMINATOR)
+            forward_to_host(end_raw)
 
         return file_crc == received_total_crc
     else:
@@ -147,6 +211,8 @@ while True:
     packet = packet_manager.listen(timeout=5.0)
 
     if packet is None:
+        while _LOG:
+            print(_LOG.popleft())
         print(
             "tries="
             + str(tries)
@@ -156,20 +222,15 @@ while True:
             + str(bad_images)
         )
         tries += 1
+    elif packet == b"fmstl":
+        print("got an image packet indicator")
+        if receive_and_verify_image(packet_manager):
+            print("succesfully received and verified an file!")
+            received_images += 1
+        else:
+            print("failed to receive and or verify image.")
+            bad_images += 1
     else:
-        try:
-            packet_text = packet.decode("utf-8")
-
-            if packet_text == "fmstl":
-                print("got an image packet indicator")
-                if receive_and_verify_image(packet_manager):
-                    print("succesfully received and verified an file!")
-                    received_images += 1
-                else:
-                    print("failed to receive and or verify image.")
-                    bad_images += 1
-
-        except UnicodeError as e:
-            print(
-                f"could not decode unicode. raw packet: {str(packet)}\nerror: {e}\nmost likely this is an beacon or something similar!"
-            )
+        print(
+            f"raw packet: {str(packet)}\nmost likely this is an beacon or something similar!"
+        )
@@ -126,9 +126,10 @@ while True:
                 )
 
                 img_file_path = get_incrementing_image_path()
-                img_file = open(img_file_path, "w")
+                img_file = open(img_file_path, "wb")
 
                 start = time.time()
+                failed = False
 
                 for i in range(stats.total_chunks):
                     packed_chunk = ser.read_until(expected=USB_TERMINATOR).rstrip(
@@ -138,9 +139,8 @@ while True:
                     stats.recv_bytes_total += len(packed_chunk)
                     stats.recv_bytes += len(packed_chunk)
 
-                    indicator, crc32, stats.current_chunk = struct.unpack(
-                        START_OR_DATA_HEADER_SIZE,
-                        packed_chunk[:START_OR_DATA_HEADER_SIZE],
+                    indicator, crc32, stats.current_chunk = struct.unpack_from(
+                        START_OR_DATA_HEADER, packed_chunk
                     )
 
                     chunk = packed_chunk[START_OR_DATA_HEADER_SIZE:]
@@ -152,19 +152,20 @@ while True:
                         print(
                             f"data packet type indicator byte was not data, was instead {indicator}"
                         )
-                        stats.failed_images += 1
+                        failed = True
                         break
 
+                    # The ground station only checks the file CRC, chunks are verified here
                     if zlib.crc32(chunk) != crc32:
                         print("chunk crc does not match")
-                        stats.failed_images += 1
+                        failed = True
                         break
 
                     if i != stats.current_chunk:
                         print(
                             f"loop index ({i}) is not chunk index ({stats.current_chunk})"
                         )
-                        stats.failed_images += 1
+                        failed = True
                         break
 
                     img_file.write(chunk)
@@ -172,8 +173,16 @@ while True:
                     pretty_station_stats(stats)
 
                 end = time.time()
+                img_file.close()
 
-                stats.recv_images += 1
+                if not failed and stats.received_total_crc != stats.file_crc:
+                    print("file crc does not match")
+                    failed = True
+
+                if failed:
+                    stats.failed_images += 1
+                else:
+                    stats.recv_images += 1
                 stats.recent_image_path = img_file_path.replace(os.getcwd(), "")
                 stats.recent_image_size = os.path.getsize(img_file_path)
                 stats.recv_time = start - end